@@ -5,7 +5,6 @@ Abstact Data Structures over neo4j.
 :date: Feb 2023
 """
 
-import pkg_resources
 from .core import ElementDomain
 
 from .simple import SimpleNumber, SimpleInteger, SimpleFloat, SimpleDate
@@ -14,7 +14,7 @@ An ``AbstractDLList`` is represented in Neo4j with the following object diagram:
              ]
 
         ADS_DLList [
-            label = "{{a:AbstractDLList|+head|+name}}"
+            label = "{{a:AbstractDLList|+head|+tail|+name}}"
             ]
 
         ADS_DLListItem1 [
@@ -34,6 +34,7 @@ An ``AbstractDLList`` is represented in Neo4j with the following object diagram:
         ]
         
         ADS_DLList -> ADS_DLListItem1 [label="DLL_NXT"]
+        ADS_DLList -> ADS_DLListItem2 [label="DLL_TAIL"]
         ADS_DLListItem1 -> ADS_DLListItem2 [label="DLL_NXT"]
         ADS_DLListItem2 -> ADS_DLListItem1 [label="DLL_PRV"]
         ADS_DLListItem1 -> ADS_ElementDomain1 [label="ABSTRACT_STRUCT_ITEM_VALUE"]
@@ -57,6 +58,7 @@ For more details please see :ref:`datamodeling`
 
 """
 
+import functools
 import neomodel
 from .core import PersistentElement
 from .composite_array import CompositeArrayNumber
@@ -64,10 +66,194 @@ from . import exception
 from .ads_core import AbstractStructItem, CompositeAbstract
 
 
+# Removes all items of the list ``$self`` and resets its length.
+_CYPHER_CLEAR = ("MATCH (a_list) WHERE elementId(a_list)=$self SET a_list.length=0, a_list.item_ids=[] "
+                 "WITH a_list OPTIONAL MATCH (data_item:DLListItem{list_name:a_list.name}) DETACH DELETE data_item")
+
+# Returns the element held at a given position (``$idx``) of the list named ``$nme``.
+# The lookup is served by the (list_name, item_id) index rather than by hopping from the head of the list.
+_CYPHER_GETITEM = ("MATCH (:DLListItem{list_name:$nme, item_id:$idx})-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) "
+                   "RETURN a_value")
+
+# Links list items that have just been created at positions ``offset`` onwards of ``a_list``.
+# The list's head (if the list was empty) and tail pointers are updated and the new items are linked to each other (and
+# to the item at ``offset-1``) by looking them up through their (list_name, item_id).
+# This is a query suffix, it expects ``a_list`` and ``offset`` to be bound and ``a_list.length`` to be up to date.
+_CYPHER_LINK_NEW_ITEMS = ("WITH a_list, offset "
+                          "MATCH (first_item:DLListItem{list_name:a_list.name, item_id:offset}), "
+                          "(last_item:DLListItem{list_name:a_list.name, item_id:a_list.length-1}) "
+                          "CREATE (a_list)-[:DLL_TAIL]->(last_item) "
+                          "FOREACH (_ IN CASE WHEN offset=0 THEN [1] ELSE [] END | "
+                          "CREATE (a_list)-[:DLL_NXT]->(first_item)) "
+                          "WITH a_list, offset "
+                          "MATCH (this_item:DLListItem{list_name:a_list.name}) "
+                          "WHERE this_item.item_id>=offset-1 AND this_item.item_id<a_list.length-1 "
+                          "MATCH (next_item:DLListItem{list_name:a_list.name, item_id:this_item.item_id+1}) "
+                          "CREATE (this_item)-[:DLL_NXT]->(next_item), (next_item)-[:DLL_PRV]->(this_item)")
+
+# Appends the elements ``$value_ids`` to the list ``$self`` and returns the list's new length.
+# Only elements that exist in the DBMS are appended, the length and positions are derived from these elements. If none
+# of the elements exists, the list is not modified and no rows are returned.
+_CYPHER_EXTEND = ("MATCH (a_list) WHERE elementId(a_list)=$self "
+                  "UNWIND range(0, size($value_ids)-1) AS k "
+                  "MATCH (a_value) WHERE elementId(a_value)=$value_ids[k] "
+                  "WITH a_list, k, a_value ORDER BY k "
+                  "WITH a_list, collect(a_value) AS new_values "
+                  "OPTIONAL MATCH (a_list)-[old_tail_link:DLL_TAIL]->(:DLListItem) "
+                  "WITH a_list, old_tail_link, new_values, a_list.length AS offset "
+                  "DELETE old_tail_link "
+                  "SET a_list.length=offset+size(new_values), "
+                  "a_list.item_ids=coalesce(a_list.item_ids, [])+[a_value IN new_values | id(a_value)] "
+                  "WITH a_list, new_values, offset "
+                  "UNWIND range(0, size(new_values)-1) AS k "
+                  "WITH a_list, offset, k, new_values[k] AS a_value "
+                  "CREATE (:DLListItem:AbstractStructItem{list_name:a_list.name, item_id:offset+k})"
+                  "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) "
+                  "WITH DISTINCT a_list, offset "
+                  "CALL { " + _CYPHER_LINK_NEW_ITEMS + " } "
+                  "RETURN a_list.length")
+
+# Deletes the item at position ``$idx`` of the list ``$self``.
+# The item's neighbours are linked to each other (or to the list's head / tail pointers if the item was at either end of
+# the list), the positions of the items that followed it are shifted down by one and the list's length is decremented.
+_CYPHER_DELITEM = ("MATCH (a_list) WHERE elementId(a_list)=$self "
+                   "MATCH (an_item:DLListItem{list_name:a_list.name, item_id:$idx}) "
+                   "OPTIONAL MATCH (an_item)-[:DLL_PRV]->(prev_item:DLListItem) "
+                   "OPTIONAL MATCH (an_item)-[:DLL_NXT]->(next_item:DLListItem) "
+                   "FOREACH (_ IN CASE WHEN prev_item IS NOT NULL AND next_item IS NOT NULL THEN [1] ELSE [] END | "
+                   "CREATE (prev_item)-[:DLL_NXT]->(next_item), (next_item)-[:DLL_PRV]->(prev_item)) "
+                   "FOREACH (_ IN CASE WHEN prev_item IS NULL AND next_item IS NOT NULL THEN [1] ELSE [] END | "
+                   "CREATE (a_list)-[:DLL_NXT]->(next_item)) "
+                   "FOREACH (_ IN CASE WHEN prev_item IS NOT NULL AND next_item IS NULL THEN [1] ELSE [] END | "
+                   "CREATE (a_list)-[:DLL_TAIL]->(prev_item)) "
+                   "DETACH DELETE an_item "
+                   "SET a_list.length=a_list.length-1, "
+                   "a_list.item_ids=coalesce(a_list.item_ids, [])[..$idx]+coalesce(a_list.item_ids, [])[$idx+1..] "
+                   "WITH a_list "
+                   "OPTIONAL MATCH (following_item:DLListItem{list_name:a_list.name}) WHERE following_item.item_id>$idx "
+                   "SET following_item.item_id=following_item.item_id-1 "
+                   "RETURN DISTINCT a_list.length")
+
+# Concatenates the (non empty) list ``$other_id`` to the list ``$self`` and deletes the **ENTRY** of ``$other_id``.
+# The head of the other list is linked after the tail of this list (or becomes the head of this list if it is empty),
+# the tail of the other list becomes the tail of this list and the items of the other list are re-assigned to this list,
+# shifting their position by the length of this list.
+_CYPHER_MERGE = ("MATCH (a_list) WHERE elementId(a_list)=$self "
+                 "MATCH (other_list)-[:DLL_NXT]->(other_head:DLListItem) WHERE elementId(other_list)=$other_id "
+                 "MATCH (other_list)-[:DLL_TAIL]->(other_tail:DLListItem) "
+                 "OPTIONAL MATCH (a_list)-[old_tail_link:DLL_TAIL]->(this_tail:DLListItem) "
+                 "FOREACH (_ IN CASE WHEN this_tail IS NULL THEN [1] ELSE [] END | "
+                 "CREATE (a_list)-[:DLL_NXT]->(other_head)) "
+                 "FOREACH (_ IN CASE WHEN this_tail IS NULL THEN [] ELSE [1] END | "
+                 "CREATE (this_tail)-[:DLL_NXT]->(other_head), (other_head)-[:DLL_PRV]->(this_tail)) "
+                 "CREATE (a_list)-[:DLL_TAIL]->(other_tail) "
+                 "DELETE old_tail_link "
+                 "WITH a_list, other_list, a_list.length AS offset "
+                 "SET a_list.length=a_list.length+other_list.length, "
+                 "a_list.item_ids=coalesce(a_list.item_ids, [])+coalesce(other_list.item_ids, []) "
+                 "WITH a_list, other_list, offset "
+                 "MATCH (an_item:DLListItem{list_name:other_list.name}) "
+                 "SET an_item.list_name=a_list.name, an_item.item_id=an_item.item_id+offset "
+                 "WITH DISTINCT a_list, other_list "
+                 "DETACH DELETE other_list "
+                 "RETURN a_list.length")
+
+# Appends the element ``$value_id`` to the list ``$self``.
+# A new item is created after the current tail (or as the head if the list is empty), it becomes the list's new tail and
+# the list's length is incremented, all in one statement.
+_CYPHER_APPEND = ("MATCH (a_list) WHERE elementId(a_list)=$self "
+                  "MATCH (a_value) WHERE elementId(a_value)=$value_id "
+                  "OPTIONAL MATCH (a_list)-[old_tail_link:DLL_TAIL]->(tail_item:DLListItem) "
+                  "CREATE (a_list)-[:DLL_TAIL]->(new_item:DLListItem:AbstractStructItem{list_name:a_list.name, item_id:a_list.length})"
+                  "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) "
+                  "FOREACH (_ IN CASE WHEN tail_item IS NULL THEN [1] ELSE [] END | "
+                  "CREATE (a_list)-[:DLL_NXT]->(new_item)) "
+                  "FOREACH (_ IN CASE WHEN tail_item IS NULL THEN [] ELSE [1] END | "
+                  "CREATE (tail_item)-[:DLL_NXT]->(new_item), (new_item)-[:DLL_PRV]->(tail_item)) "
+                  "DELETE old_tail_link "
+                  "SET a_list.length=a_list.length+1, a_list.item_ids=coalesce(a_list.item_ids, [])+[id(a_value)] "
+                  "RETURN a_list.length")
+
+# Upgrades lists that were created before list items recorded their list and position.
+# Each such list is traversed once from its head, its items are assigned their ``list_name, item_id``, its tail pointer,
+# length and ``item_ids`` are set. Lists that are already in the current layout are not matched.
+_CYPHER_UPGRADE_LISTS = ("MATCH (a_list:AbstractDLList)-[:DLL_NXT]->(head_item:DLListItem) "
+                         "WHERE head_item.list_name IS NULL "
+                         "MATCH item_path=(head_item)-[:DLL_NXT*0..]->(tail_item:DLListItem) "
+                         "WHERE NOT EXISTS {(tail_item)-[:DLL_NXT]->(:DLListItem)} "
+                         "WITH a_list, tail_item, nodes(item_path) AS list_items "
+                         "SET a_list.length=size(list_items), "
+                         "a_list.item_ids=[a_list_item IN list_items | "
+                         "head([(a_list_item)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) | id(a_value)])] "
+                         "MERGE (a_list)-[:DLL_TAIL]->(tail_item) "
+                         "WITH a_list, list_items "
+                         "UNWIND range(0, size(list_items)-1) AS k "
+                         "WITH a_list, list_items[k] AS an_item, k "
+                         "SET an_item.list_name=a_list.name, an_item.item_id=k")
+
+# Index supporting positional lookups of list items
+_CYPHER_INDEX_DLLISTITEM = ("CREATE INDEX dllistitem_list_name_item_id IF NOT EXISTS "
+                            "FOR (n:DLListItem) ON (n.list_name, n.item_id)")
+
+
+def _cypher_string(a_string):
+    """
+    Returns ``a_string`` as a CYPHER string literal, escaping any characters that would terminate it.
+    """
+    return "'" + a_string.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+# Builders of the query fragments returned by ``AbstractDLList.project_as, with_this_list_as, iterate_by_query``.
+# The fragments only depend on their arguments and are therefore cached.
+@functools.lru_cache(maxsize=256)
+def _build_project_as_fragment(this_list_labels, name, this_list_known_as, projection_known_as, projected_field,
+                               pass_through):
+    nme = _cypher_string(name)
+    listIdentifier = this_list_known_as
+    projectedField = projected_field
+    projectionKnownAs = projection_known_as
+
+    # If the projected field is none, then the id of the item that the list is holding is to be emitted.
+    # These are maintained on the list's entry (as `item_ids`) and do not require traversing the list.
+    if projected_field is None:
+        item_query = f"MATCH ({listIdentifier}:{this_list_labels}{{name:{nme}}}) WITH {listIdentifier} WITH coalesce({listIdentifier}.item_ids, []) as {projectionKnownAs}  "
+    else:
+        item_query = f"MATCH ({listIdentifier}:{this_list_labels}{{name:{nme}}}) WITH {listIdentifier} MATCH ({listIdentifier})-[:DLL_NXT*]->({listIdentifier}_listItem:DLListItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->({listIdentifier}_listItemValue) WITH collect({listIdentifier}_listItemValue.{projectedField}) as {projectionKnownAs}  "
+    # If there are pass through variables add them in the final query
+    if pass_through is not None:
+        pass_through_items = ",".join(pass_through)
+        modified_with = f"WITH {pass_through_items},"
+        split_query = item_query.split("WITH")
+        item_query = split_query[0]+modified_with+split_query[1]+modified_with+split_query[2]
+    return item_query
+
+
+@functools.lru_cache(maxsize=256)
+def _build_with_this_list_fragment(this_list_labels, name, this_list_known_as, other_lists):
+    nme = _cypher_string(name)
+    list_known_as = this_list_known_as
+    other_lists = f",{','.join(other_lists)}" if other_lists else ""
+
+    # TODO: HIGH, Propagate the lists correctly.
+    return f"MATCH (aList:{this_list_labels}{{name:{nme}}}) WITH aList{other_lists} MATCH (aList)-[:DLL_NXT*]->(:DLListItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(aList_listItemValue) WITH collect(aList_listItemValue) AS {list_known_as}{other_lists}"
+
+
+@functools.lru_cache(maxsize=256)
+def _build_iterate_fragment(this_list_labels, name, this_list_known_as):
+    return f"MATCH ({this_list_known_as}:{this_list_labels}{{name:{_cypher_string(name)}}}) WITH {this_list_known_as} MATCH ({this_list_known_as})-[:DLL_NXT*]->({this_list_known_as}_listItem:DLListItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->({this_list_known_as}_listItemValue) WITH {this_list_known_as}_listItemValue "
+
+
 class DLListItem(AbstractStructItem):
     """
     A struct item of a doubly linked list.
+
+    Each item also records the name of the list it belongs to and its (zero based) position within that list, so
+    that indexed access does not have to traverse the list.
     """
+    # The name of the list this item belongs to
+    list_name = neomodel.StringProperty(index=True)
+    # The position of this item in the list
+    item_id = neomodel.IntegerProperty()
     # Pointer to the next item in the list
     prv = neomodel.RelationshipTo("DLListItem", "DLL_PRV")
     # Pointer to the previous item in the list
@@ -80,12 +266,53 @@ class AbstractDLList(CompositeAbstract):
 
     .. note::
 
-        Although the list is Doubly Linked, only the list's ``head`` is preserved with the List entry.
+        Both the list's ``head`` and ``tail`` are preserved with the List entry, so that appending to the list does
+        not have to traverse it.
+
+        The list's entry also maintains the numeric IDs (CYPHER ``id()``, not ``elementId()``) of the elements it
+        holds, in order, as ``item_ids``. This property is maintained at server side and is not mapped to the Python
+        object. Numeric IDs are kept because they are what ``project_as()`` has always emitted and what
+        ``CompositeArrayNumber`` (and therefore ``from_id_array()``) can hold.
+
+        Indexed access relies on a composite index over the ``list_name, item_id`` of ``DLListItem``. This
+        index is created via ``AbstractDLList.ensure_indexes()``.
 
     """
     head = neomodel.RelationshipTo("DLListItem", "DLL_NXT")
+    tail = neomodel.RelationshipTo("DLListItem", "DLL_TAIL")
     length = neomodel.IntegerProperty(default=0)
 
+    @classmethod
+    def ensure_indexes(cls):
+        """
+        Creates (if they do not already exist) the indexes that ``AbstractDLList`` relies on for fast lookups.
+
+        These are:
+
+            * The uniqueness constraint (and therefore index) on the ``name`` of this class and its descendants, so
+              that a list is located by an index seek rather than a label scan.
+            * The indexes of ``DLListItem``.
+
+        Lists that were created by earlier versions of ``neoads`` (whose items do not record their list and position)
+        are upgraded to the current layout at the same time.
+
+        .. note::
+
+            This only needs to be called once per database, in a way similar to ``neomodel.install_all_labels()``.
+            It **must** be called on databases that hold lists created by earlier versions, before these lists are
+            accessed.
+        """
+        # This class and all of its descendants, visited through a work queue
+        classes_to_install = [cls]
+        while classes_to_install:
+            a_class = classes_to_install.pop()
+            neomodel.db.install_labels(a_class)
+            classes_to_install.extend(a_class.__subclasses__())
+        # The list items are installed on their own, their descendants (if any) are not part of this list's hierarchy
+        neomodel.db.install_labels(DLListItem)
+        neomodel.db.cypher_query(_CYPHER_INDEX_DLLISTITEM)
+        neomodel.db.cypher_query(_CYPHER_UPGRADE_LISTS)
+
     def __len__(self):
         """
         Returns the length of the list.
@@ -112,35 +339,32 @@ class AbstractDLList(CompositeAbstract):
 
         """
         self._pre_action_check('clear')
-        nme = self.name
-        this_list_labels = ":".join(self.labels())
         # TODO: Notice here that queries use static labels on the auxiliary objects (e.g. DLListItem). This means that it they were to be extended, the queries would pick the generic class and not the specific. The top level object though use all of its labels and therefore matches the specific list. This does not cause problems as long as the elements that compose the structure of the list do not need to be overriden
-        self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{nme}'}})-[:DLL_NXT*]-(data_item:DLListItem) DETACH DELETE data_item")
+        # The length is reset in the same query that removes the items, no separate save() is required.
+        self.cypher(_CYPHER_CLEAR)
         self.length = 0
-        self.save()
 
     def __getitem__(self, item_index):
         """
         Implements indexed lookup.
 
-        :param item_index: An integer index that if not within limits, raises IndexError exception
+        :param item_index: An integer index that if not within limits, raises IndexError exception. Negative indices
+                           count from the end of the list.
         :type item_index: int
         :return: PersistentElement
         """
 
         # TODO: HIGH, Does this need a `_pre_action_check` or would that slow things down?
-        # NOTE: Here, I am always reaching out from the head but it is faster to reach out from the current position.
-        # NOTE: MyList[0] takes 0.00518 and MyList[3000] takes 0.2510 to finish.
 
         # Find the DL List item
-        if item_index < 0 or item_index > self.length:
+        if item_index < 0:
+            item_index += self.length
+        if item_index < 0 or item_index >= self.length:
             raise IndexError(f"Index {item_index} out of bounds in a list of length {self.length}")
-        #.format(**{"idx": item_index + 1, "self": "{self}"})
-        idx = item_index + 1 # The 'item+1' is required to offset the hop from the head to the first item.
-        list_record = self.cypher(f"MATCH (a)-[:DLL_NXT*{idx}]->(b:DLListItem) WHERE ID(a)=$self RETURN b")
-        item_value = DLListItem.inflate(list_record[0][0][0])
-        # TODO: HIGH, This must return the actual object
-        return item_value.value[0]
+        # The element is retrieved along with the list item and resolved to its actual class, in one query.
+        list_record, _ = neomodel.db.cypher_query(_CYPHER_GETITEM, {"nme": self.name, "idx": item_index},
+                                                  resolve_objects=True)
+        return list_record[0][0]
 
     def __delitem__(self, item_index):
         """
@@ -153,36 +377,14 @@ class AbstractDLList(CompositeAbstract):
         :param key: Index to the item in the list to be deleted
         :type key: int
         """
-        # TODO: LOW, Reduce code duplication with __getitem__ in retrieving the DL list item.
-        if item_index < 0 or item_index > self.length:
+        if item_index < 0:
+            item_index += self.length
+        if item_index < 0 or item_index >= self.length:
             raise IndexError(f"Index {item_index} out of bounds in a list of length {self.length}")
-            # The 'item+1' is required to offset the hop from the head to the first item.
-        # First of all locate the item ...
-        list_record = self.cypher(f"MATCH (a)-[:DLL_NXT*{item_index + 1}]->(b:DLListItem) WHERE ID(a)=$self RETURN b")
-        item_object = DLListItem.inflate(list_record[0][0][0])
-        # ...disconnect it from the list depending on its location...
-        if len(item_object.nxt) == 1 and len(item_object.prv) == 1:
-            # This is a middle item
-            # Bypass it
-            item_object.prv[0].nxt.reconnect(item_object,item_object.nxt[0])
-            item_object.nxt[0].prv.reconnect(item_object,item_object.prv[0])
-
-        if len(item_object.nxt) == 1 and len(item_object.prv) == 0:
-            # This is a head item
-            # Have the list's head point to the next item
-            self.head.reconnect(item_object, item_object.nxt[0])
-
-        if len(item_object.nxt) == 0 and len(item_object.prv) == 1:
-            # TODO: HIGH, Remove this branch
-            # This is a tail item
-            # Nothing special needs to be done
-            pass
-        # ... delete the item
-        item_object.delete()
-        # Adjust the length of the list
-        self.length -= 1
-        # Save the modification to this list
-        self.save()
+        # Locate the item, bypass it, delete it, shift the items that followed it and adjust the length of the list.
+        # All of this happens at server side, the new length is read back so that this object does not need to be saved.
+        result, _ = self.cypher(_CYPHER_DELITEM, {"idx": item_index})
+        self.length = result[0][0]
 
     def project_as(self,this_list_known_as, projection_known_as, projected_field=None, pass_through=None):
         """
@@ -209,25 +411,8 @@ class AbstractDLList(CompositeAbstract):
         :return: str (CYPHER query fragment)
         """
 
-        # If the projected field is none, then the id of the item that the list is holding is to be emitted
-        if projected_field is None:
-
-            nme = self.name
-            this_list_labels = ":".join(self.labels())
-            listIdentifier = this_list_known_as
-            projectedField = projected_field
-            projectionKnownAs = projection_known_as
-
-            item_query = f"MATCH ({listIdentifier}:{this_list_labels}{{name:'{nme}'}}) WITH {listIdentifier} MATCH ({listIdentifier})-[:DLL_NXT*]->({listIdentifier}_listItem:DLListItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->({listIdentifier}_listItemValue) WITH collect(id({listIdentifier}_listItemValue)) as {projectionKnownAs}  "
-        else:
-            item_query = "MATCH ({listIdentifier}:{this_list_labels}{{name:'{nme}'}}) WITH {listIdentifier} MATCH ({listIdentifier})-[:DLL_NXT*]->({listIdentifier}_listItem:DLListItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->({listIdentifier}_listItemValue) WITH collect({listIdentifier}_listItemValue.{projectedField}) as {projectionKnownAs}  "
-        # If there are pass through variables add them in the final query
-        if pass_through is not None:
-            pass_through_items = ",".join(pass_through)
-            modified_with = f"WITH {pass_through_items},"
-            split_query = item_query.split("WITH")
-            item_query = split_query[0]+modified_with+split_query[1]+modified_with+split_query[2]
-        return item_query
+        return _build_project_as_fragment(self._labels_str(), self.name, this_list_known_as, projection_known_as,
+                                          projected_field, tuple(pass_through) if pass_through is not None else None)
 
     def with_this_list_as(self, this_list_known_as, other_lists = None):
         """
@@ -239,16 +424,8 @@ class AbstractDLList(CompositeAbstract):
         :type other_lists: list
         :return: str (CYPHER query fragment)
         """
-        #.format(nme=self.name, list_known_as=this_list_known_as, other_lists=",{}".format(",".join(other_lists)) if other_lists is not None else "")
-        #",{}".format(",".join(other_lists)) if other_lists is not None else "")
-
-        nme = self.name
-        this_list_labels =  ":".join(labels())
-        list_known_as = this_list_known_as
-        other_lists = ",{','.join(other_lists) if other_lists is not None else ''}"
-
-        # TODO: HIGH, Propagate the lists correctly.
-        return f"MATCH (aList:{this_list_labels}{{name:'{nme}'}}) WITH aList{other_lists} MATCH (aList)-[:DLL_NXT*]->(:DLListItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(aList_listItemValue) WITH collect(aList_listItemValue) AS {list_known_as}{other_lists}"
+        return _build_with_this_list_fragment(self._labels_str(), self.name, this_list_known_as,
+                                              tuple(other_lists) if other_lists is not None else None)
 
     def iterate_by_query(self, this_list_known_as):
         """
@@ -280,8 +457,7 @@ class AbstractDLList(CompositeAbstract):
         :type this_list_known_as: str
         """
         # TODO: HIGH, Must verify if this match does indeed reach all of the items in the list or it skips the last one.
-        this_list_labels = ":".join(self.labels())
-        return f"MATCH ({listIdentifier}:{this_list_labels}{{name:'{self.name}'}}) WITH {this_list_known_as} MATCH ({this_list_known_as})-[:DLL_NXT*]->({this_list_known_as}_listItem:DLListItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->({this_list_known_as}_listItemValue) WITH {this_list_known_as}_listItemValue "
+        return _build_iterate_fragment(self._labels_str(), self.name, this_list_known_as)
 
     def extend_by_merging(self,another_dlList):
         """
@@ -292,51 +468,22 @@ class AbstractDLList(CompositeAbstract):
         :return: AbstractDLList
         """
 
-        if type(another_dlList) is str:
-            other_list = AbstractDLList.nodes.get(name = another_dlList)[0]
-        elif type(another_dlList) is AbstractDLList:
+        self._pre_action_check("extend_by_merging")
+        if isinstance(another_dlList, str):
+            other_list = AbstractDLList.nodes.get(name = another_dlList)
+        elif isinstance(another_dlList, AbstractDLList):
             other_list = another_dlList
         else:
-            raise TypeError("extend_by_merging expected AbstractDLList received {type(another_dlList)}")
-
-        # If both lists are non-empty, then it is worth going ahead with a full merge
-        if len(self) > 0 and len(other_list) > 0:
-            # Retrieve the tail STRUCT item of THIS list.
-            # The tail struct item has DLL_PRV but no DLL_NXT
-            this_list_labels = ":".join(self.labels())
-            this_list_tail_item = DLListItem.inflate(self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{self.name}'}})-[:DLL_NXT*]-(data_item:DLListItem) WHERE NOT (data_item)-[:DLL_NXT]->() RETURN data_item")[0][0][0])
-            # Retrieve the head STRUCT item of the other list.
-            # The head item is readily available
-            other_list_head_item = other_list.head[0]
-            # Effect the concatenation
-            this_list_tail_item.nxt.connect(other_list_head_item)
-            other_list_head_item.prv.connect(this_list_tail_item)
-            # Adjust the length of this list.
-            self.length += other_list.length
-            # Delete the **ENTRY** of the other list
-            other_list_labels = ":".join(other_list.labels())
-            other_list.cypher(f"MATCH (a:{other_list_labels}{{name:'{other_list.name}'}}) "
-                              "DETACH DELETE a")
-            # Update this list so that its length gets written back
-            self.save()
+            raise TypeError(f"extend_by_merging expected AbstractDLList received {type(another_dlList)}")
+
+        if len(other_list) > 0:
+            # Link, re-assign the items and delete the **ENTRY** of the other list, all at server side.
+            # The new length is read back so that this object does not need to be saved.
+            result, _ = self.cypher(_CYPHER_MERGE, {"other_id": other_list.element_id})
+            self.length = result[0][0]
         else:
-            # If this list is empty but other_list is not then there is no point in going ahead with a full merge
-            if len(self) > 0:
-                # Grab the other list's head
-                self.head.connect(other_list.head[0])
-                # Copy its length too
-                self.length = other_list.length
-                # Get rid of the other list's entry ONLY! (delete vs destroy)
-                # Delete the **ENTRY** of the other list
-                other_list_labels = ":".join(other_list.labels())
-                other_list.cypher(f"MATCH (a:{other_list_labels}{{name:'{other_list.name}'}}) "
-                                  "DETACH DELETE a")
-            # Update the info of this list
-                self.save()
-            else:
-                # If other_list is empty, then again there is no point in going ahead with a full merge
-                other_list.destroy()
-            # If both lists are empty, no further action is taken
+            # If other_list is empty, then there is no point in going ahead with a merge
+            other_list.destroy()
         return self
 
     def append(self, an_element):
@@ -344,39 +491,54 @@ class AbstractDLList(CompositeAbstract):
         Appends any PersistentElement to the Doubly Linked List.
 
         :param an_element: PersistentElement
+        :raises ObjectUnsavedError: When ``an_element`` has not been saved.
+        :raises ObjectDeletedError: When ``an_element`` has been deleted.
         :return: AbstractDLList (self)
         """
         self._pre_action_check("append")
         if not isinstance(an_element, PersistentElement):
             raise TypeError(f"AbstractDLList.append() expected PersistentElement, received {type(an_element)}.")
+        # The element is located by its element id, it must therefore exist in the DBMS.
+        an_element._pre_action_check("append")
+
+        # Create the new list item, link it to the list and update the list's length at server side.
+        # The length is read back so that this object does not need to be saved.
+        result, _ = self.cypher(_CYPHER_APPEND, {"value_id": an_element.element_id})
+        self.length = result[0][0]
+        return self
 
-        # Prepare a new list item
-        new_list_item = DLListItem().save()
-        # Connect it to the element
-        new_list_item.value.connect(an_element)
+    def extend(self, elements):
+        """
+        Appends all PersistentElements of an iterable to the Doubly Linked List.
 
-        # If this list is empty, then `an_element` will become the list's head
-        if len(self) == 0:
-            self.head.connect(new_list_item)
-            self.length +=1
-        else:
-            # This list is not empty and the new item will have to be added to the list's tail.
-            # Find the tail
-            # TODO: HIGH, Reduce duplication here by adding a _get_tail() to AbstractDLList or alternatively establish
-            #       two pointers for faster operation
-            this_list_labels = ":".join(self.labels())
-            this_list_tail_item = DLListItem.inflate(self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{self.name}'}})-[:DLL_NXT*]-(data_item:DLListItem) "
-                                                                 "WHERE NOT (data_item)-[:DLL_NXT]->() RETURN data_item")[0][0][0])
-            # Connect it to the list (so that the new element becomes the list's tail)
-            this_list_tail_item.nxt.connect(new_list_item)
-            new_list_item.prv.connect(this_list_tail_item)
-            # Adjust the length of this list
-            self.length += 1
-        # Update the list because either of the above branches lead to an update.
-        self.save()
+        .. note::
+
+            This is equivalent to calling ``append`` for each one of ``elements`` but the list is extended at server
+            side, with a single query.
+
+        :param elements: An iterable of PersistentElement
+        :type elements: iterable
+        :raises ObjectUnsavedError: When any of ``elements`` has not been saved.
+        :raises ObjectDeletedError: When any of ``elements`` has been deleted.
+        :return: AbstractDLList (self)
+        """
+        self._pre_action_check("extend")
+        elements = list(elements)
+        for an_element in elements:
+            if not isinstance(an_element, PersistentElement):
+                raise TypeError(f"AbstractDLList.extend() expected PersistentElement, received {type(an_element)}.")
+            # The elements are located by their element id, they must therefore exist in the DBMS.
+            an_element._pre_action_check("extend")
+        if len(elements) == 0:
+            return self
+        # Create, link and count the new list items at server side.
+        # The length is read back so that this object does not need to be saved.
+        result, _ = self.cypher(_CYPHER_EXTEND, {"value_ids": [an_element.element_id for an_element in elements]})
+        if len(result) > 0:
+            self.length = result[0][0]
         return self
 
-    def from_query(self, query, auto_reset=False):
+    def from_query(self, query, auto_reset=False, params=None):
         """
         Populates a doubly linked list at server side.
 
@@ -387,9 +549,6 @@ class AbstractDLList(CompositeAbstract):
 
         .. warning::
 
-            At the moment, the way the CYPHER queries that build the list are expressed, they seem to "explode" with
-            the number of items returned by from_query(..., query). So use with caution.
-
             If the query returns duplicates, these are retained in the list because a list does not behave like a set.
 
          **EXAMPLE:**
@@ -407,6 +566,10 @@ class AbstractDLList(CompositeAbstract):
         :param auto_reset: Whether to re-use the list node by first clearing
                            the contents of the list prior to populating it.
         :type auto_reset: bool
+        :param params: Values for any ``$parameters`` used in ``query``. Passing values as parameters rather than
+                       formatting them in to ``query`` allows the server to re-use the query's plan. The parameter
+                       name ``self`` is reserved.
+        :type params: dict
         :raises ContainerNotEmpty: When ``from_query`` is called on an already populated List. Use ``auto_reset=True`` to discard the current list items and reset it to the result of ``from_query``.
         :return: AbstractDLList (self)
         """
@@ -416,41 +579,20 @@ class AbstractDLList(CompositeAbstract):
         elif len(self)>0:
             raise exception.ContainerNotEmpty(f"Attempted to reset non empty AbstractDLList {self.name}")
 
-        dprem_query_fragment = {False:"",True:",count(ListItem) as ListItem_CNT "}
-
-        # Ensure initial conditions on the present list
-        this_list_labels = ":".join(self.labels())
-        self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{self.name}'}}) SET a_list.length=0")
-        # Create list items and index them sequentially
-        nme = self.name
+        # The list is known to be empty at this point (it has either just been cleared or it was found empty).
         match_query = query
         # TODO: HIGH, if match_query contains WITH it must be ensured that aList is propagated in that query, otherwise this would fail (see also from_id_array)
-        # dup_removal = dprem_query_fragment[no_duplicates]
-        # self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{nme}'}}) WITH a_list {match_query} WITH a_list, ListItem{dup_removal} CREATE (a_list)-[:TEMP_LINK{{of_list:a_list.name,item_id:a_list.length}}]->(an_item:DLListItem:AbstractStructItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(ListItem) SET a_list.length=a_list.length+1")
-        # self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{nme}'}}) WITH a_list {match_query} WITH a_list, collect(ListItem) as lids " 
-        #             f"UNWIND [k in range(0, size(lids)-1) | [a_list, k, lids[k]]] as node_data "
-        #             f"WITH node_data[0] AS origin, node_data[1] AS list_item_idx, node_data[2] AS list_item "
-        #             f"CREATE (origin)-[:TEMP_LINK{{of_list:origin.name,item_id:list_item_idx}}]->(:DLListItem:AbstractStructItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(list_item)")
-        self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{nme}'}}) WITH a_list {match_query} WITH a_list, collect(ListItem) as lids SET a_list.length = size(lids) "
-                    f"WITH a_list, lids UNWIND [k in range(0, size(lids)-1) | [a_list, k, lids[k]]] as node_data "
-                    f"WITH node_data[0] AS origin, node_data[1] AS list_item_idx, node_data[2] AS list_item "
-                    f"CREATE (origin)-[:TEMP_LINK{{of_list:origin.name,item_id:list_item_idx}}]->(:DLListItem:AbstractStructItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(list_item)")
-        
-        # Create the double linked list connections
-        # Create forwards connections
-        #self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{self.name}'}})-[r1:TEMP_LINK{{of_list:a_list.name}}]->(this_item:DLListItem:AbstractStructItem) WHERE r1.item_id<a_list.length WITH a_list,r1,this_item MATCH (a_list)-[r2:TEMP_LINK{{of_list:a_list.name}}]->(next_item:DLListItem:AbstractStructItem) WHERE r2.item_id=r1.item_id+1 CREATE (this_item)-[:DLL_NXT]->(next_item)")
-
-        self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{self.name}'}})-[r1:TEMP_LINK{{of_list:a_list.name}}]->(this_item:DLListItem:AbstractStructItem) "
-                    f"WITH a_list,r1,this_item MATCH (a_list)-[r2:TEMP_LINK{{of_list:a_list.name}}]->(next_item:DLListItem:AbstractStructItem) "
-                    f"WHERE r2.item_id=r1.item_id+1 CREATE (this_item)-[:DLL_NXT]->(next_item)")
-        # Create backwards connections
-        self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{self.name}'}})-[r1:TEMP_LINK{{of_list:a_list.name}}]->(this_item:DLListItem:AbstractStructItem) WHERE r1.item_id>0 WITH a_list,r1,this_item MATCH (a_list)-[r2:TEMP_LINK{{of_list:a_list.name}}]->(previous_item:DLListItem:AbstractStructItem) WHERE r2.item_id=r1.item_id-1 CREATE (this_item)-[:DLL_PRV]->(previous_item)")
-        
-        # Connect the items to the head of the list
-        self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{self.name}'}})-[r:TEMP_LINK{{of_list:a_list.name,item_id:0}}]->(a_list_item:DLListItem) WITH a_list,a_list_item CREATE (a_list)-[:DLL_NXT]->(a_list_item)")
-
-        # Delete the temporary links
-        self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{self.name}'}})-[r:TEMP_LINK{{of_list:a_list.name}}]->(:DLListItem) DELETE r")
+        # Create the list items, index them sequentially and link them, all in one query
+        self.cypher(f"MATCH (a_list) WHERE elementId(a_list)=$self WITH a_list {match_query} "
+                    "WITH a_list, collect(ListItem) AS lids "
+                    "SET a_list.length=size(lids), a_list.item_ids=[an_item IN lids | id(an_item)] "
+                    "WITH a_list, lids, 0 AS offset UNWIND range(0, size(lids)-1) AS k "
+                    "WITH a_list, offset, k, lids[k] AS list_item "
+                    "CREATE (:DLListItem:AbstractStructItem{list_name:a_list.name, item_id:offset+k})"
+                    "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(list_item) "
+                    "WITH DISTINCT a_list, offset "
+                    + _CYPHER_LINK_NEW_ITEMS,
+                    params)
         # Now, length has changed, so this entity needs to be refreshed
         self.refresh()
         return self
@@ -465,6 +607,9 @@ class AbstractDLList(CompositeAbstract):
             Because of the dangers associated with maintaining IDs for long intervals it is best if these two are
             called in quick succession.
 
+            The IDs are taken from the ``value`` of the array object as it is held locally. If the array was populated
+            with ``from_query_IDs(..., refresh=False)``, it should be refreshed first.
+
         :param array_of_ids: The name or actual object of an array of IDs.
         :type array_of_ids: str or CompositeArrayNumber
         :return: AbstractDLList (self)
@@ -482,11 +627,10 @@ class AbstractDLList(CompositeAbstract):
         else:
             raise TypeError(f"from_id_array expected str or CompositeArrayNumber, received {type(array_of_ids)}")
 
-        labels = ":".join(array_object.labels())
-        name = array_object.name
-
-        # Notice here that I am simply re-using from_query
-        self.from_query(f"MATCH (array:{labels}{{name:'{name}'}}) WITH a_list, array MATCH (ListItem) WHERE id(ListItem) in array.value")
+        # Notice here that I am simply re-using from_query.
+        # The IDs are sent as a parameter, so that the array node does not have to be looked up at server side.
+        self.from_query("UNWIND $item_ids AS item_id MATCH (ListItem) WHERE id(ListItem)=item_id",
+                        params={"item_ids": [int(an_id) for an_id in array_object.value]})
         return self
 
     def iterforward(self):
@@ -509,12 +653,11 @@ class AbstractDLList(CompositeAbstract):
         """
         Returns the list's wrapper object at the tail of the list
         """
-        if self.get_head() is None:
-            return None
-
-        this_list_labels = ":".join(self.labels())
-        this_list_tail_item = DLListItem.inflate(self.cypher(f"MATCH (a_list:{this_list_labels}{{name:'{self.name}'}})-[:DLL_NXT*]-(data_item:DLListItem) WHERE NOT (data_item)-[:DLL_NXT]->() RETURN data_item")[0][0][0])
-        return this_list_tail_item
+        try:
+            tail_object = self.tail.get()
+        except neomodel.DoesNotExist:
+            tail_object = None
+        return tail_object
 
 
 class AbstractDLListIterator:
@@ -42,10 +42,71 @@ An ``AbstractMap`` is represented in Neo4j as follows:
 import neomodel
 from .core import PersistentElement
 from . import exception
-from .ads_abstractset import SetItem, AbstractSet
+from .ads_abstractset import AbstractSet
 from .ads_core import CompositeAbstract
 
 
+# Returns the keys and values sets of the map ``$self``
+_CYPHER_RESOLVE = ("MATCH (a_map)-[:KEYS_SET]->(keys_set:AbstractSet), (a_map)-[:VALUES_SET]->(values_set:AbstractSet) "
+                   "WHERE elementId(a_map)=$self RETURN keys_set, values_set")
+
+# Returns the number of keys of the map ``$self`` (zero if the map has not been initialised yet)
+_CYPHER_LEN = ("MATCH (a_map)-[:KEYS_SET]->(:AbstractSet)-[:SET_ELEMENT]->(key_item:SetItem) "
+               "WHERE elementId(a_map)=$self RETURN count(key_item)")
+
+# Returns whether the map ``$self`` contains a key with hash ``$hash``
+_CYPHER_CONTAINS = ("MATCH (a_map)-[:KEYS_SET]->(:AbstractSet)-[:SET_ELEMENT]->(key_item:SetItem{hash_value:$hash}) "
+                    "WHERE elementId(a_map)=$self RETURN count(key_item)>0")
+
+# Returns the value that is associated with the hash ``$hash`` in the map ``$self``
+_CYPHER_GETITEM = ("MATCH (a_map)-[:VALUES_SET]->(:AbstractSet)-[:SET_ELEMENT]->(:SetItem{hash_value:$hash})"
+                   "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) WHERE elementId(a_map)=$self RETURN a_value LIMIT 1")
+
+# Removes the key and value items with hash ``$hash`` from the map ``$self``, returning the number of items removed
+_CYPHER_DELITEM = ("MATCH (a_map)-[:KEYS_SET|VALUES_SET]->(:AbstractSet)"
+                   "-[:SET_ELEMENT]->(an_item:SetItem{hash_value:$hash}) WHERE elementId(a_map)=$self "
+                   "WITH collect(an_item) AS items FOREACH (an_item IN items | DETACH DELETE an_item) "
+                   "RETURN size(items)")
+
+# Returns a page of ``$limit`` objects that are pointed to by the items of the set ``$set_id``, along with the element
+# id of each item. Items are ordered by their element id and the page starts after the item ``$after``.
+_CYPHER_SET_VALUES_PAGE = ("MATCH (a_set)-[:SET_ELEMENT]->(an_item:SetItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) "
+                           "WHERE elementId(a_set)=$set_id AND elementId(an_item)>$after "
+                           "RETURN a_value, elementId(an_item) AS item_id ORDER BY item_id LIMIT $limit")
+
+# Removes all items from the keys and values sets of the map ``$self``
+_CYPHER_CLEAR = ("MATCH (a_map)-[:KEYS_SET|VALUES_SET]->(:AbstractSet)-[:SET_ELEMENT]->(an_item:SetItem) "
+                 "WHERE elementId(a_map)=$self DETACH DELETE an_item")
+
+# Removes the keys and values sets of the map ``$self`` along with their items (if the map has been initialised)
+_CYPHER_DESTROY_SETS = ("MATCH (a_map) WHERE elementId(a_map)=$self "
+                        "OPTIONAL MATCH (a_map)-[:KEYS_SET|VALUES_SET]->(a_set:AbstractSet) "
+                        "OPTIONAL MATCH (a_set)-[:SET_ELEMENT]->(an_item:SetItem) "
+                        "DETACH DELETE an_item, a_set")
+
+# Sets (or resets) the entries ``$rows`` (a list of ``{hash, key_id, value_id}``) of a map given the map's keys set
+# (``$keys_set_id``) and values set (``$values_set_id``).
+# A key is only added to the keys set if its hash does not already exist there, while the value that is associated with
+# a hash is always replaced.
+_CYPHER_UPSERT = ("MATCH (keys_set:AbstractSet) WHERE elementId(keys_set)=$keys_set_id "
+                  "MATCH (values_set:AbstractSet) WHERE elementId(values_set)=$values_set_id "
+                  "UNWIND $rows AS row "
+                  "MATCH (a_key) WHERE elementId(a_key)=row.key_id "
+                  "MATCH (a_value) WHERE elementId(a_value)=row.value_id "
+                  "OPTIONAL MATCH (keys_set)-[:SET_ELEMENT]->(key_item:SetItem{hash_value:row.hash}) "
+                  "FOREACH (_ IN CASE WHEN key_item IS NULL THEN [1] ELSE [] END | "
+                  "CREATE (keys_set)-[:SET_ELEMENT]->(:SetItem:AbstractStructItem{hash_value:row.hash})"
+                  "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_key)) "
+                  "WITH values_set, row, a_value "
+                  "OPTIONAL MATCH (values_set)-[:SET_ELEMENT]->(value_item:SetItem{hash_value:row.hash}) "
+                  "DETACH DELETE value_item "
+                  "WITH DISTINCT values_set, row, a_value "
+                  "CREATE (values_set)-[:SET_ELEMENT]->(:SetItem:AbstractStructItem{hash_value:row.hash})"
+                  "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
+
+# Returned by ``AbstractMap.get`` to ``__getitem__`` for keys that do not exist in the map
+_MISSING = object()
+
 
 # TODO: MED, Also needs initialisation by two existing AbstractSets, which could help with the recovery of stray
 #            elements.
@@ -60,6 +121,12 @@ class AbstractMap(CompositeAbstract):
 
     keys_set = neomodel.RelationshipTo("AbstractSet", "KEYS_SET", cardinality=neomodel.One)
     values_set = neomodel.RelationshipTo("AbstractSet", "VALUES_SET",cardinality=neomodel.One)
+    # The resolved keys and values sets (see ``_resolve``)
+    _ks = None
+    _vs = None
+
+    # The number of objects retrieved per query while iterating over keys or values
+    _page_size = 1000
 
     @property
     def keys(self):
@@ -67,12 +134,12 @@ class AbstractMap(CompositeAbstract):
         Return an iterator to keys.
 
         :returns: An iterator to the neoads elements that make up the `AbstractSet` of keys.
-        :rtype: list
+        :rtype: generator
         """
-        try:
-            return map(lambda x:x.value[0], self.keys_set[0].elements.all())
-        except IndexError:
+        keys_set, _ = self._resolve(initialise=False)
+        if keys_set is None:
             return None
+        return self._iterate_set(keys_set, self._page_size)
 
     @property
     def values(self):
@@ -80,12 +147,40 @@ class AbstractMap(CompositeAbstract):
         Return an iterator to values.
 
         :returns: An iterator to the neoads elements that make up the `AbstractSet` of values.
-        :rtype: list
+        :rtype: generator
         """
-        try:
-            return map(lambda x:x.value[0], self.values_set[0].elements.all())
-        except IndexError:
+        _, values_set = self._resolve(initialise=False)
+        if values_set is None:
             return None
+        return self._iterate_set(values_set, self._page_size)
+
+    @staticmethod
+    def _iterate_set(a_set, page_size):
+        """
+        Yields the objects that are pointed to by the items of a set, retrieving them from the DBMS one page at a time.
+
+        .. note::
+
+            Only the current page is held in memory. As with Python's ``dict``, the map should not be modified while
+            it is being iterated over.
+
+        :param a_set: One of the map's keys or values sets
+        :type a_set: AbstractSet
+        :param page_size: The number of objects to retrieve per query
+        :type page_size: int
+        :return: generator
+        """
+        # Each page resumes after the last item seen, rather than skipping over the items of the previous pages.
+        after = ""
+        while True:
+            page, _ = neomodel.db.cypher_query(_CYPHER_SET_VALUES_PAGE,
+                                               {"set_id": a_set.element_id, "after": after, "limit": page_size},
+                                               resolve_objects=True)
+            for a_row in page:
+                yield a_row[0]
+            if len(page) < page_size:
+                break
+            after = page[-1][1]
 
     def _init_map(self):
         """
@@ -105,6 +200,58 @@ class AbstractMap(CompositeAbstract):
         new_values_set = AbstractSet().save()
         self.keys_set.connect(new_keys_set)
         self.values_set.connect(new_values_set)
+        self._ks = new_keys_set
+        self._vs = new_values_set
+
+    def _resolve(self, initialise=True):
+        """
+        Returns the keys and values sets of the map.
+
+        .. note::
+
+            The sets are retrieved with a single query the first time they are required and are then cached with the
+            object. The cache is invalidated by ``refresh`` and ``destroy``.
+
+        :param initialise: Whether to initialise the map if it has not been initialised yet. If ``False`` and the map
+                           has not been initialised, ``(None, None)`` is returned.
+        :type initialise: bool
+        :return: tuple (AbstractSet, AbstractSet)
+        """
+        if self._ks is None or self._vs is None:
+            result, _ = self.cypher(_CYPHER_RESOLVE)
+            if len(result) > 0:
+                self._ks = AbstractSet.inflate(result[0][0])
+                self._vs = AbstractSet.inflate(result[0][1])
+            elif initialise:
+                self._init_map()
+        return self._ks, self._vs
+
+    def refresh(self):
+        """
+        Reloads the map from the DBMS, invalidating its cached keys and values sets.
+        """
+        self._ks = None
+        self._vs = None
+        return super().refresh()
+
+    def _upsert(self, rows):
+        """
+        Sets / resets a number of map entries at server side, with a single query.
+
+        .. warning::
+
+            Not meant to be called directly. The rows must not contain duplicate hashes.
+
+        :param rows: A list of dictionaries with keys ``hash`` (the hex formatted hash of the key), ``key_id`` and
+                     ``value_id`` (the element IDs of the key and value objects respectively).
+        :type rows: list
+        :return: AbstractMap (self)
+        """
+        keys_set, values_set = self._resolve()
+        neomodel.db.cypher_query(_CYPHER_UPSERT, {"keys_set_id": keys_set.element_id,
+                                                  "values_set_id": values_set.element_id,
+                                                  "rows": rows})
+        return self
 
     def __len__(self):
         """
@@ -113,10 +260,7 @@ class AbstractMap(CompositeAbstract):
         :return: int
         """
         self._pre_action_check("__len__")
-        try:
-            return len(self.keys_set[0])
-        except IndexError:
-            return 0
+        return self.cypher(_CYPHER_LEN)[0][0][0]
 
     def __delitem__(self, key):
         """
@@ -128,10 +272,8 @@ class AbstractMap(CompositeAbstract):
         :return:
         """
         self._pre_action_check("__delitem__")
-        key_set_element = SetItem.inflate(self.keys_set[0].retrieve_by_hash(key._neoads_hash())[0])
-        value_set_element = SetItem.inflate(self.values_set[0].retrieve_by_hash(key._neoads_hash())[0])
-        key_set_element.delete()
-        value_set_element.delete()
+        if self.cypher(_CYPHER_DELITEM, {"hash": f"{key._neoads_hash():x}"})[0][0][0] == 0:
+            raise KeyError(key)
 
     def __contains__(self, item):
         """
@@ -139,18 +281,14 @@ class AbstractMap(CompositeAbstract):
 
         .. note::
 
-            This basically re-uses the IN operator for AbstractSet.
+            The key is looked up by its hash in the keys set, at server side.
 
         :param item: An object
         :type item: PersistentElement
         :return:
         """
         self._pre_action_check("__contains__")
-        try:
-            return self.keys_set[0].contains_hash(item._neoads_hash())
-        except IndexError:
-            self._init_map()
-            return False
+        return self.cypher(_CYPHER_CONTAINS, {"hash": f"{item._neoads_hash():x}"})[0][0][0]
 
     def __getitem__(self, key):
         """
@@ -161,14 +299,28 @@ class AbstractMap(CompositeAbstract):
         :return: PersistentElement
         """
         self._pre_action_check("__getitem__")
-        try:
-            if key in self.keys_set[0]:
-                set_item_element = self.values_set[0].retrieve_by_hash(key._neoads_hash())
-                return SetItem.inflate(set_item_element[0]).value[0]
-        except IndexError:
-            self._init_map()
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
 
-        raise KeyError("{key}")
+    def get(self, key, default=None):
+        """
+        Returns the value associated with the key or ``default`` if the key does not exist in the map, in a way
+        similar to Python's ``dict.get()``.
+
+        :param key: Any hashable object.
+        :type key: PersistentElement
+        :param default: The value to return if ``key`` does not exist in the map.
+        :return: PersistentElement
+        """
+        self._pre_action_check("get")
+        result, _ = neomodel.db.cypher_query(_CYPHER_GETITEM,
+                                             {"self": self.element_id, "hash": f"{key._neoads_hash():x}"},
+                                             resolve_objects=True)
+        if len(result) == 0:
+            return default
+        return result[0][0]
 
     def __setitem__(self, key, value):
         """
@@ -182,27 +334,50 @@ class AbstractMap(CompositeAbstract):
         :type key: PersistentElement
         :param value: A `value` object.
         :type value: PersistentElement
+        :raises ObjectUnsavedError: When ``key`` or ``value`` has not been saved.
+        :raises ObjectDeletedError: When ``key`` or ``value`` has been deleted.
         :return:
         """
         self._pre_action_check("__setitem__")
         if not isinstance(value, PersistentElement):
             raise TypeError(f"AbstractMap assignment expected PersistentElement, received {type(value)}")
-        try:
-            if not key in self.keys_set[0]:
-                self.keys_set[0].add(key)
-                self.values_set[0].add_with_hash(value, key._neoads_hash())
-            else:
-                # The key does exist in the map and its value has to be updated
-                key_hash = key._neoads_hash()
-                self.values_set[0].remove_by_hash(key_hash)
-                self.values_set[0].add_with_hash(value, key_hash)
-        except IndexError:
-            # The map has not been initialised yet
-            self._init_map()
-            self.keys_set[0].add(key)
-            self.values_set[0].add_with_hash(value, key._neoads_hash())
-
-    def from_keyvalue_node_query(self, a_query, auto_reset=False):
+        # The key and value are located by their element id, they must therefore exist in the DBMS.
+        key._pre_action_check("__setitem__")
+        value._pre_action_check("__setitem__")
+        # Whether the key exists in the map or not is resolved at server side
+        self._upsert([{"hash": f"{key._neoads_hash():x}", "key_id": key.element_id, "value_id": value.element_id}])
+
+    def update(self, mapping):
+        """
+        Sets / resets a number of keys to be pointing to specific values, in a way similar to Python's ``dict.update()``.
+
+        .. note::
+
+            This is equivalent to a sequence of assignments but the map is updated at server side, with a single query.
+            If ``mapping`` contains keys with the same hash, the last one is retained.
+
+        :param mapping: A mapping (or an iterable of key, value pairs) of `key` objects to `value` objects.
+        :type mapping: dict or iterable
+        :raises ObjectUnsavedError: When any key or value has not been saved. The map is not modified.
+        :raises ObjectDeletedError: When any key or value has been deleted. The map is not modified.
+        :return: AbstractMap (self)
+        """
+        self._pre_action_check("update")
+        if hasattr(mapping, "items"):
+            mapping = mapping.items()
+        rows = {}
+        for key, value in mapping:
+            if not isinstance(value, PersistentElement):
+                raise TypeError(f"AbstractMap assignment expected PersistentElement, received {type(value)}")
+            key._pre_action_check("update")
+            value._pre_action_check("update")
+            key_hash = f"{key._neoads_hash():x}"
+            rows[key_hash] = {"hash": key_hash, "key_id": key.element_id, "value_id": value.element_id}
+        if len(rows) > 0:
+            self._upsert(list(rows.values()))
+        return self
+
+    def from_keyvalue_node_query(self, a_query, auto_reset=False, params=None):
         """
         Instantiates an AbstractMap via a query.
 
@@ -226,6 +401,15 @@ class AbstractMap(CompositeAbstract):
                Q.from_keyvalue_node_query("MATCH (a:ElementVariable) WHERE a.value IN [1,2,3] WITH collect(a) AS Keys
                MATCH (b:ElementVariable) WHERE b.value IN ["One","Two","Three"] WITH Keys, collect(b) as Values")
 
+            Any values that vary between calls should be passed via ``params`` rather than formatted in to the query,
+            so that the server can re-use the query's plan:
+
+            ::
+
+               Q.from_keyvalue_node_query("MATCH (a:ElementVariable) WHERE a.value IN $key_values WITH collect(a) AS Keys
+               MATCH (b:ElementVariable) WHERE b.value IN $value_values WITH Keys, collect(b) as Values",
+               params={"key_values": [1,2,3], "value_values": ["One","Two","Three"]})
+
             
             The objects in the array will have to be inflated in to Python, their hash calculated and then used to
             construct the sets.
@@ -234,28 +418,32 @@ class AbstractMap(CompositeAbstract):
         :type a_query: str
         :param auto_reset:
         :type auto_param: bool
+        :param params: Values for any ``$parameters`` used in ``a_query``.
+        :type params: dict
         :return: AbstractMap (self)
         """
         self._pre_action_check("from_keyvalue_node_query")
 
-        if auto_reset or len(self.keys_set)==0:
+        if auto_reset or self._resolve(initialise=False)[0] is None:
             self.clear()
         elif len(self)>0:
             raise exception.ContainerNotEmpty(f"Attempted to reset non empty AbstractMap {self.name}")
         # Query the database to retrieve the key/value pairs
         # TODO: HIGH, Must check if a_query contains the variables Key and Value and does not contain a "return"
-        keyvalue_list, _ = neomodel.db.cypher_query(a_query, resolve_objects=True)
+        keyvalue_list, _ = neomodel.db.cypher_query(a_query, params, resolve_objects=True)
         # Check if the returned arrays have the same length
         if len(keyvalue_list[0][0][0])!=len(keyvalue_list[0][1][0]):
             raise Exception("Arrays not the same size")
         else:
-            # Pre-compute the hash values
-            hash_values = [f"{an_object._neoads_hash():x}" for an_object in keyvalue_list[0][0][0]]
+            # Pair each key with its hash in a single pass and reuse the same hashes for the values
+            key_pairs = [(f"{an_object._neoads_hash():x}", an_object.element_id) for an_object in keyvalue_list[0][0][0]]
+            value_pairs = list(zip((a_pair[0] for a_pair in key_pairs),
+                                   (an_object.element_id for an_object in keyvalue_list[0][1][0])))
+            keys_set, values_set = self._resolve()
             # Build the key set
-            self.keys_set[0].from_hash_nodeid_list(list(zip(hash_values, [an_object.element_id for an_object in keyvalue_list[0][0][0]])), auto_reset=True)
+            keys_set.from_hash_nodeid_list(key_pairs, auto_reset=True)
             # Build the value set
-            self.values_set[0].from_hash_nodeid_list(list(zip(hash_values, [an_object.element_id for an_object in keyvalue_list[0][1][0]])), auto_reset=True)
-            self.refresh()
+            values_set.from_hash_nodeid_list(value_pairs, auto_reset=True)
         return self
 
     def clear(self):
@@ -263,24 +451,16 @@ class AbstractMap(CompositeAbstract):
         Clears the map.
         """
         self._pre_action_check("clear")
-        try:
-            self.values_set[0].clear()
-            self.keys_set[0].clear()
-        except IndexError:
-            self._init_map()
+        self.cypher(_CYPHER_CLEAR)
 
     def destroy(self):
         """
         Clears the map and completely removes it from the DBMS.
         """
         self._pre_action_check("destroy")
-        try:
-            key_set = self.keys_set[0]
-            value_set = self.values_set[0]
-            key_set.destroy()
-            value_set.destroy()
-        except IndexError:
-            pass
-        # The key or value sets might not have been created yet in which case we just delete the map
+        # The key or value sets might not have been created yet in which case this only deletes the map
+        self.cypher(_CYPHER_DESTROY_SETS)
+        self._ks = None
+        self._vs = None
         self.delete()
 
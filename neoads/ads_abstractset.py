@@ -44,6 +44,125 @@ from . import exception
 from .ads_core import AbstractStructItem, CompositeAbstract
 
 
+# Copies the items of the set ``$other_id`` to the set ``$self``.
+# The set ``$self`` is first emptied if ``$auto_reset`` is true, otherwise nothing is copied unless it is empty.
+# Returns whether the items were copied.
+_CYPHER_FROM_ABSTRACTSET = ("MATCH (this_set) WHERE elementId(this_set)=$self "
+                            "OPTIONAL MATCH (this_set)-[:SET_ELEMENT]->(an_old_element:SetItem) "
+                            "WITH this_set, collect(an_old_element) AS old_elements "
+                            "WHERE $auto_reset OR size(old_elements)=0 "
+                            "FOREACH (an_old_element IN old_elements | DETACH DELETE an_old_element) "
+                            "WITH this_set "
+                            "OPTIONAL MATCH (other_set)-[:SET_ELEMENT]->(an_element:AbstractStructItem:SetItem)"
+                            "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(an_element_value) WHERE elementId(other_set)=$other_id "
+                            "FOREACH (_ IN CASE WHEN an_element IS NULL THEN [] ELSE [1] END | "
+                            "CREATE (this_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{hash_value:an_element.hash_value})"
+                            "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(an_element_value)) "
+                            "RETURN count(*)>0")
+
+# Adds the elements ``$rows`` (a list of ``{hash, value_id}``) to the set ``$self``.
+_CYPHER_FROM_HASH_NODEID_LIST = ("MATCH (a_set) WHERE elementId(a_set)=$self "
+                                 "UNWIND $rows AS row "
+                                 "MATCH (a_value) WHERE elementId(a_value)=row.value_id "
+                                 "CREATE (a_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{hash_value:row.hash})"
+                                 "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
+
+# Returns the number of items of the set ``$self``.
+_CYPHER_LEN = "MATCH (a_set)-[:SET_ELEMENT]->(an_element:SetItem) WHERE elementId(a_set)=$self RETURN count(an_element)"
+
+# Returns whether the sets ``$self`` and ``$other_id`` are equal.
+# Sets do not contain duplicate hashes, therefore two sets of the same length are equal if every hash of one is also a
+# hash of the other. Each hash is probed individually, stopping at the first one that is missing, and only if the
+# lengths match.
+_CYPHER_EQ = ("MATCH (this_set) WHERE elementId(this_set)=$self "
+              "MATCH (other_set) WHERE elementId(other_set)=$other_id "
+              "RETURN CASE WHEN COUNT {(this_set)-[:SET_ELEMENT]->(:SetItem)}<>"
+              "COUNT {(other_set)-[:SET_ELEMENT]->(:SetItem)} THEN false "
+              "ELSE NOT EXISTS {MATCH (this_set)-[:SET_ELEMENT]->(u:SetItem) "
+              "WHERE NOT EXISTS {MATCH (other_set)-[:SET_ELEMENT]->(:SetItem{hash_value:u.hash_value})}} END")
+
+# Adds the items of the set ``$left_id`` and the items of the set ``$right_id`` whose hash does not exist in the set
+# ``$left_id`` to the set ``$new_id``.
+_CYPHER_UNION = ("MATCH (new_set) WHERE elementId(new_set)=$new_id "
+                 "MATCH (left_set) WHERE elementId(left_set)=$left_id "
+                 "MATCH (right_set) WHERE elementId(right_set)=$right_id "
+                 "CALL {WITH left_set "
+                 "MATCH (left_set)-[:SET_ELEMENT]->(an_element:SetItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) "
+                 "RETURN an_element.hash_value AS a_hash, a_value "
+                 "UNION ALL "
+                 "WITH left_set, right_set "
+                 "MATCH (right_set)-[:SET_ELEMENT]->(an_element:SetItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) "
+                 "WHERE NOT EXISTS {MATCH (left_set)-[:SET_ELEMENT]->(:SetItem{hash_value:an_element.hash_value})} "
+                 "RETURN an_element.hash_value AS a_hash, a_value} "
+                 "CREATE (new_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{hash_value:a_hash})"
+                 "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
+
+# Adds the items of the set ``$left_id`` whose hash exists in the set ``$right_id`` to the set ``$new_id``.
+_CYPHER_INTERSECTION = ("MATCH (new_set) WHERE elementId(new_set)=$new_id "
+                        "MATCH (right_set) WHERE elementId(right_set)=$right_id "
+                        "MATCH (left_set)-[:SET_ELEMENT]->(left_element:AbstractStructItem:SetItem)"
+                        "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) WHERE elementId(left_set)=$left_id "
+                        "AND EXISTS {MATCH (right_set)-[:SET_ELEMENT]->(:SetItem{hash_value:left_element.hash_value})} "
+                        "CREATE (new_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{hash_value:left_element.hash_value})"
+                        "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
+
+# Adds the items of the set ``$left_id`` whose hash does not exist in the set ``$right_id`` to the set ``$new_id``.
+_CYPHER_DIFFERENCE = ("MATCH (new_set) WHERE elementId(new_set)=$new_id "
+                      "MATCH (right_set) WHERE elementId(right_set)=$right_id "
+                      "MATCH (left_set)-[:SET_ELEMENT]->(left_element:AbstractStructItem:SetItem)"
+                      "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) WHERE elementId(left_set)=$left_id "
+                      "AND NOT EXISTS {MATCH (right_set)-[:SET_ELEMENT]->(:SetItem{hash_value:left_element.hash_value})} "
+                      "CREATE (new_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{hash_value:left_element.hash_value})"
+                      "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
+
+# Adds the items of the sets ``$left_id`` and ``$right_id`` whose hash does not exist in the other set to the set
+# ``$new_id``, i.e. (A-B)|(B-A).
+_CYPHER_SYMMETRIC_DIFFERENCE = ("MATCH (new_set) WHERE elementId(new_set)=$new_id "
+                                "MATCH (left_set) WHERE elementId(left_set)=$left_id "
+                                "MATCH (right_set) WHERE elementId(right_set)=$right_id "
+                                "CALL {WITH left_set, right_set "
+                                "MATCH (left_set)-[:SET_ELEMENT]->(an_element:SetItem)"
+                                "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) "
+                                "WHERE NOT EXISTS {MATCH (right_set)-[:SET_ELEMENT]->(:SetItem{hash_value:an_element.hash_value})} "
+                                "RETURN an_element.hash_value AS a_hash, a_value "
+                                "UNION ALL "
+                                "WITH left_set, right_set "
+                                "MATCH (right_set)-[:SET_ELEMENT]->(an_element:SetItem)"
+                                "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) "
+                                "WHERE NOT EXISTS {MATCH (left_set)-[:SET_ELEMENT]->(:SetItem{hash_value:an_element.hash_value})} "
+                                "RETURN an_element.hash_value AS a_hash, a_value} "
+                                "CREATE (new_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{hash_value:a_hash})"
+                                "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
+
+# Adds the elements ``$rows`` (a list of ``{hash, value_id}``) to the set ``$self``, skipping those whose hash already
+# exists in the set.
+_CYPHER_ADD = ("MATCH (a_set) WHERE elementId(a_set)=$self "
+               "UNWIND $rows AS row "
+               "MATCH (a_value) WHERE elementId(a_value)=row.value_id "
+               "OPTIONAL MATCH (a_set)-[:SET_ELEMENT]->(an_element:SetItem{hash_value:row.hash}) "
+               "WITH a_set, row, a_value, an_element WHERE an_element IS NULL "
+               "CREATE (a_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{hash_value:row.hash})"
+               "-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
+
+# Returns whether the set ``$self`` contains an item with hash ``$hash``.
+_CYPHER_CONTAINS_HASH = ("MATCH (a_set) WHERE elementId(a_set)=$self "
+                         "RETURN EXISTS {MATCH (a_set)-[:SET_ELEMENT]->(:SetItem{hash_value:$hash})}")
+
+# Returns the item of the set ``$self`` with hash ``$hash``.
+_CYPHER_RETRIEVE_BY_HASH = ("MATCH (a_set)-[:SET_ELEMENT]->(an_element:SetItem{hash_value:$hash}) "
+                            "WHERE elementId(a_set)=$self RETURN an_element")
+
+# Removes the item of the set ``$self`` with hash ``$hash``, returning the number of items removed.
+_CYPHER_REMOVE_BY_HASH = ("MATCH (a_set)-[:SET_ELEMENT]->(an_element:SetItem{hash_value:$hash}) "
+                          "WHERE elementId(a_set)=$self "
+                          "WITH collect(an_element) AS elements FOREACH (an_element IN elements | DETACH DELETE an_element) "
+                          "RETURN size(elements)")
+
+# Removes all items of the set ``$self``.
+_CYPHER_CLEAR = ("MATCH (a_set)-[:SET_ELEMENT]->(el_item:SetItem) "
+                 "WHERE elementId(a_set)=$self DETACH DELETE el_item")
+
+
 class SetItem(AbstractStructItem):
     """
     A struct item that is an element of a set.
@@ -90,25 +209,12 @@ class AbstractSet(CompositeAbstract):
         if not issubclass(type(an_abstractSet), AbstractSet):
             raise TypeError(f"from_abstractset expects 'AbstractSet' received {type(an_abstractSet)}")
 
-        # Empty the current values
-        if auto_reset:
-            self.clear()
-        elif len(self)>0:
+        # Emptying the current values (or refusing to overwrite them) is resolved at server side
+        is_copied, _ = self.cypher(_CYPHER_FROM_ABSTRACTSET, {"other_id": an_abstractSet.element_id,
+                                                              "auto_reset": auto_reset})
+        if not is_copied[0][0]:
             raise exception.ContainerNotEmpty(f"Attempted to reset non empty AbstractSet {self.name}")
 
-        this_set_labels = ":".join(self.labels())
-        this_set_name = self.name
-        other_set_labels = ":".join(an_abstractSet.labels())
-        other_set_name = an_abstractSet.name
-
-        self.cypher(f"MATCH (this_set:{this_set_labels}{{name:'{this_set_name}'}}), "
-                    f"(other_set:{other_set_labels}{{name:'{other_set_name}'}})-[:SET_ELEMENT]->"
-                    "(an_element:AbstractStructItem:SetItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->"
-                    "(an_element_value) CREATE (this_set)-[:SET_ELEMENT]->"
-                    "(:AbstractStructItem:SetItem{hash_value:an_element.hash_value})-[:ABSTRACT_STRUCT_ITEM_VALUE]->"
-                    "(an_element_value)")
-
-        self.refresh()
         return self
 
     def from_query(self, query, auto_reset=False):
@@ -156,21 +262,18 @@ class AbstractSet(CompositeAbstract):
             self.clear()
         elif len(self)>0:
             raise exception.ContainerNotEmpty("Attempted to reset non empty AbstractSet {}".format(self.name))
-        
-        this_set_name = self.name
-        this_set_labels = ":".join(self.labels())
 
         # TODO: HIGH, Amend CompositeAbstract and then edit this query to take into account the composite hash
         # TODO: HIGH, `from_query` can now go into CompositeAbstract
     
-        self.cypher(f"MATCH (a_set:{this_set_labels}{{name:'{this_set_name}'}}) WITH a_set {query} with a_set, SetElement, properties(SetElement) as p,  "
-                    f"keys(properties(SetElement)) as k order by k with a_set, COLLECT([SetElement, apoc.util.sha256([reduce(v=\"\", m in [u in k where u<>\"name\"|u+p[u]]|v+m)])]) as SetElementAndHash "
-                    f"UNWIND SetElementAndHash as SetElementAndHashItem with a_set, SetElementAndHashItem order by SetElementAndHashItem[1] "
-                    f"WITH a_set, collect(SetElementAndHashItem) as OrderedSetElementAndHash with a_set, [i in range(0, size(OrderedSetElementAndHash)-1) WHERE i=0 or OrderedSetElementAndHash[i][1] <> OrderedSetElementAndHash[i-1][1]|OrderedSetElementAndHash[i]] as FinalSetElementAndHash "
-                    f"UNWIND FinalSetElementAndHash as FSEA with a_set, FSEA[0] as TheSetElement, FSEA[1] as TheSetElementHash "
-                    f"CREATE (a_set)-[:SET_ELEMENT]->(an_item:SetItem:AbstractStructItem{{hash_value:TheSetElementHash}})-[:ABSTRACT_STRUCT_ITEM_VALUE]->(TheSetElement)")
-
-        self.refresh()
+        # Elements with the same hash are grouped (rather than sorted and compared with their neighbour) and only one
+        # element per hash is added to the set.
+        self.cypher(f"MATCH (a_set) WHERE elementId(a_set)=$self WITH a_set {query} with a_set, SetElement, properties(SetElement) as p,  "
+                    "keys(properties(SetElement)) as k order by k "
+                    "WITH a_set, SetElement, apoc.util.sha256([reduce(v=\"\", m in [u in k where u<>\"name\"|u+p[u]]|v+m)]) as TheSetElementHash "
+                    "WITH a_set, TheSetElementHash, collect(SetElement)[0] as TheSetElement "
+                    "CREATE (a_set)-[:SET_ELEMENT]->(an_item:SetItem:AbstractStructItem{hash_value:TheSetElementHash})-[:ABSTRACT_STRUCT_ITEM_VALUE]->(TheSetElement)")
+
         return self
 
     def from_hash_nodeid_list(self, a_hash_nodeid_list, auto_reset=False):
@@ -181,6 +284,10 @@ class AbstractSet(CompositeAbstract):
 
             Not to be called directly.
 
+        .. note::
+
+            The node IDs are element IDs (see ``element_id``) and the hashes can be given either as integers or as
+            lowercase hex strings.
 
         :param a_hash_nodeid_list: A list of tuples
         :type a_hash_nodeid_list: list
@@ -201,18 +308,9 @@ class AbstractSet(CompositeAbstract):
         elif len(self)>0:
             raise exception.ContainerNotEmpty(f"Attempted to reset non empty AbstractSet {self.name}")
 
-        #self.cypher("WITH {the_hash_nodeid_list} AS hash_nodeid_list UNWIND hash_nodeid_list AS hash_nodeid_item MERGE (a_set:AbstractSet{{name:'{this_set_name}'}})-[:SET_ELEMENT]->(a_set_element:AbstractStructItem:setElement{{hash_value:hash_nodeid_list[0]}}) ON CREATE MATCH (a_value_node) where id(a_value_node)=hash_node_list[1] CREATE (a_set_element)-[:ABSTRACT_STRUCT_VALUE]->(a_value_node) ON MATCH MATCH (a_set_element:setElement)-[r:ABSTRACT_STRUCT_VALUE]->(some_node) detach delete r MATCH (a_value_node) where id(a_value_node)=hash_node_list[1] CREATE (a_set_element)-[:ABSTRACT_STRUCT_VALUE]->(a_value_node)".format(**{"the_hash_nodeid_list":str(a_hash_nodeid_list).replace("(","[").replace(")","]"),"this_set_name":self.name}))
-        the_hash_nodeid_list = str(a_hash_nodeid_list).replace("(", "[").replace(")", "]")
-        this_set_name = self.name
-        this_set_labels = ":".join(self.labels())
-
-        self.cypher(f"MATCH (a_set:{this_set_labels}{{name:'{this_set_name}'}}) "
-                    f"WITH a_set,{the_hash_nodeid_list} AS hash_nodeid_list "
-                    "UNWIND hash_nodeid_list AS hash_nodeid_item "
-                    "MATCH (a_value_node) WHERE id(a_value_node)=hash_nodeid_item[1] "
-                    "CREATE (a_set)-[:SET_ELEMENT]->"
-                    "(a_set_element:AbstractStructItem:SetItem{hash_value:hash_nodeid_item[0]})-[:ABSTRACT_STRUCT_ITEM_VALUE]->"
-                    "(a_value_node)")
+        self.cypher(_CYPHER_FROM_HASH_NODEID_LIST,
+                    {"rows": [{"hash": f"{a_hash:x}" if isinstance(a_hash, int) else a_hash, "value_id": a_node_id}
+                              for a_hash, a_node_id in a_hash_nodeid_list]})
         return self
 
     def __len__(self):
@@ -222,7 +320,7 @@ class AbstractSet(CompositeAbstract):
         :return: int
         """
         self._pre_action_check('__len__')
-        return len(self.elements)
+        return self.cypher(_CYPHER_LEN)[0][0][0]
 
     def __eq__(self, other):
         """
@@ -241,30 +339,8 @@ class AbstractSet(CompositeAbstract):
         self._pre_action_check("__eq__")
         other._pre_action_check("__eq__")
 
-        # If the set lengths do not match then there is no point in proceeding with checking for their contents.
-        if self.__len__() != other.__len__():
-            return False
-
-        nme_left = self.name
-        nme_right = other.name
-
-        lbl_left = ":".join(self.labels())
-        lbl_right = ":".join(other.labels())
-
-        is_equal, _ = self.cypher(f"MATCH (:{lbl_left}{{name:'{nme_left}'}})-[:SET_ELEMENT]->(u:SetItem) "
-                                  "WITH u.hash_value AS u_hash ORDER BY u_hash "
-                                  f"MATCH (:{lbl_right}{{name:'{nme_right}'}})-[:SET_ELEMENT]->(v:SetItem) "
-                                  "WITH collect(u_hash) AS u_hash_array, v.hash_value AS v_hash ORDER BY v_hash "
-                                  "RETURN u_hash_array=collect(v_hash)")
-        # Alternatively, to push even the length check to the server, the query could be changed slightly to first form
-        # BOTH arrays and then test them for equality and length when they are both formed. (Otherwise it leads to
-        # re-evaluation and it is not efficient. But that would still mean that a full check would have to run even if
-        # the lengths are different, although this can be circumvented by first running a length query and THEN running
-        # the equality check (but this brings us back to what is happening now).
-        #
-        # Alternatively, the check could be performed client side with:
-        # return [setelement.hash_value for setelement in self.elements] == \
-        #        [setelement.hash_value for setelement in other.elements]
+        # The lengths of the sets are compared at server side, before their contents.
+        is_equal, _ = self.cypher(_CYPHER_EQ, {"other_id": other.element_id})
         return bool(is_equal[0][0])
 
     def __or__(self, other):
@@ -281,21 +357,9 @@ class AbstractSet(CompositeAbstract):
         self._pre_action_check("__or__")
         other._pre_action_check("__or__")
         new_set = self.__class__().save()
-        if len(self)==0:
-            new_set.from_abstractset(other, auto_reset=True)
-        else:
-            new_set.from_abstractset(self, auto_reset=True)
-
-        this_set_name = new_set.name
-        other_set_name = other.name
-        this_set_labels = ":".join(new_set.labels())
-        other_set_labels = ":".join(self.labels())
-        self.cypher(f"MATCH (this_set:{this_set_labels}{{name:'{this_set_name}'}})-[:SET_ELEMENT]->(this_set_item:AbstractStructItem) "
-                    "WITH this_set,COLLECT(this_set_item.hash_value) AS this_set_hash_nums "
-                    f"MATCH (other_set:{other_set_labels}{{name:'{other_set_name}'}})-[:SET_ELEMENT]->(other_set_item:AbstractStructItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value_node) "
-                    "WHERE NOT other_set_item.hash_value IN this_set_hash_nums "
-                    "CREATE (this_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{hash_value:other_set_item.hash_value})-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value_node);")
-        new_set.refresh()
+        neomodel.db.cypher_query(_CYPHER_UNION, {"left_id": self.element_id,
+                                                 "right_id": other.element_id,
+                                                 "new_id": new_set.element_id})
         return new_set
 
     def __and__(self, other):
@@ -312,14 +376,9 @@ class AbstractSet(CompositeAbstract):
         self._pre_action_check("__and__")
         other._pre_action_check("__and__")
         new_set = self.__class__().save()
-        this_set_name = self.name
-        other_set_name = other.name
-        new_set_name = new_set.name
-        this_set_labels = ":".join(self.labels())
-        other_set_labels = ":".join(other.labels())
-        new_set_labels = ":".join(new_set.labels())
-        self.cypher(f"MATCH (this_set:{this_set_labels}{{name:'{this_set_name}'}})-[:SET_ELEMENT]->(an_element:AbstractStructItem:SetItem) WITH COLLECT(an_element.hash_value) as this_set_hash_values MATCH (other_set:{other_set_labels}{{name:'{other_set_name}'}})-[:SET_ELEMENT]->(another_element:AbstractStructItem:SetItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_set_value) WHERE another_element.hash_value IN this_set_hash_values WITH another_element,a_set_value MATCH (new_set:{new_set_labels}{{name:'{new_set_name}'}}) CREATE (new_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{{hash_value:another_element.hash_value}})-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_set_value)")
-        new_set.refresh()
+        neomodel.db.cypher_query(_CYPHER_INTERSECTION, {"left_id": self.element_id,
+                                                        "right_id": other.element_id,
+                                                        "new_id": new_set.element_id})
         return new_set
 
     def __sub__(self, other):
@@ -337,14 +396,9 @@ class AbstractSet(CompositeAbstract):
         other._pre_action_check("__sub__")
         new_set = AbstractSet().save()
 
-        other_set_name = other.name
-        this_set_name = self.name
-        new_set_name = new_set.name
-        other_set_labels = ":".join(other.labels())
-        this_set_labels = ":".join(self.labels())
-        new_set_labels = ":".join(new_set.labels())
-        self.cypher(f"MATCH (other_set:{other_set_labels}{{name:'{other_set_name}'}})-[:SET_ELEMENT]->(other_element:AbstractStructItem:SetItem) WITH COLLECT(other_element.hash_value) AS other_set_hash_values MATCH (this_set:{this_set_labels}{{name:'{this_set_name}'}})-[:SET_ELEMENT]->(this_element:AbstractStructItem:SetItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) WHERE NOT this_element.hash_value IN other_set_hash_values WITH this_element, a_value MATCH (new_set:{new_set_labels}{{name:'{new_set_name}'}}) CREATE (new_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{{hash_value:this_element.hash_value}})-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
-        new_set.refresh()
+        neomodel.db.cypher_query(_CYPHER_DIFFERENCE, {"left_id": self.element_id,
+                                                      "right_id": other.element_id,
+                                                      "new_id": new_set.element_id})
         return new_set
 
     def __xor__(self, other):
@@ -362,25 +416,9 @@ class AbstractSet(CompositeAbstract):
         other._pre_action_check("__xor__")
         new_set = AbstractSet().save()
 
-        other_set_name = other.name
-        this_set_name = self.name
-        new_set_name = new_set.name
-        other_set_labels = ":".join(other.labels())
-        this_set_labels = ":".join(self.labels())
-        new_set_labels = ":".join(new_set.labels())
-
-        # Symmetric difference implemented as two difference queries here (A-B)|(B-A)
-        # A-B        
-        self.cypher(f"MATCH (other_set:{other_set_labels}{{name:'{other_set_name}'}})-[:SET_ELEMENT]->(other_element:AbstractStructItem:SetItem) WITH COLLECT(other_element.hash_value) AS other_set_hash_values MATCH (this_set:{this_set_labels}{{name:'{this_set_name}'}})-[:SET_ELEMENT]->(this_element:AbstractStructItem:SetItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) WHERE NOT this_element.hash_value IN other_set_hash_values WITH this_element, a_value MATCH (new_set:{new_set_labels}{{name:'{new_set_name}'}}) CREATE (new_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{{hash_value:this_element.hash_value}})-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
-
-        other_set_name = self.name
-        this_set_name = other.name
-
-        # B-A
-        self.cypher(f"MATCH (other_set:{other_set_labels}{{name:'{other_set_name}'}})-[:SET_ELEMENT]->(other_element:AbstractStructItem:SetItem) WITH COLLECT(other_element.hash_value) as other_set_hash_values MATCH (this_set:{this_set_labels}{{name:'{this_set_name}'}})-[:SET_ELEMENT]->(this_element:AbstractStructItem:SetItem)-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value) WHERE NOT this_element.hash_value IN other_set_hash_values WITH this_element, a_value MATCH (new_set:{new_set_labels}{{name:'{new_set_name}'}}) CREATE (new_set)-[:SET_ELEMENT]->(:AbstractStructItem:SetItem{{hash_value:this_element.hash_value}})-[:ABSTRACT_STRUCT_ITEM_VALUE]->(a_value)")
-        
-        # The queries operate on the same "new_set"
-        new_set.refresh()
+        neomodel.db.cypher_query(_CYPHER_SYMMETRIC_DIFFERENCE, {"left_id": self.element_id,
+                                                                "right_id": other.element_id,
+                                                                "new_id": new_set.element_id})
         return new_set
 
     def contains_hash(self, a_hash):
@@ -392,12 +430,8 @@ class AbstractSet(CompositeAbstract):
         :return: bool
         """
         # self._pre_action_check("delete")
-        nme = self.name
-        this_set_labels = ":".join(self.labels())
-        itm_hash = a_hash
-
-        # NOTE: Hash operations need '{itm_hash:x}' because hash is a string
-        return len(self.cypher(f"MATCH (a_set:{this_set_labels}{{name:'{nme}'}})-[:SET_ELEMENT]->(an_element:SetItem) WHERE an_element.hash_value='{itm_hash:x}' RETURN an_element")[0]) > 0
+        # NOTE: Hash operations need '{a_hash:x}' because hash is a string
+        return bool(self.cypher(_CYPHER_CONTAINS_HASH, {"hash": f"{a_hash:x}"})[0][0][0])
 
     def __contains__(self, an_item):
         """
@@ -413,7 +447,7 @@ class AbstractSet(CompositeAbstract):
 
     def _add_element(self, an_item, a_hash):
         """
-        Adds a new element to the set.
+        Adds a new element to the set, unless its hash already exists in the set.
 
         .. warning::
         
@@ -425,12 +459,10 @@ class AbstractSet(CompositeAbstract):
         :type a_hash: int
         :return: AbstractSet (self)
         """
-        # Create a new set item
-        new_set_item = SetItem(hash_value=a_hash).save()
-        # Connect the value
-        new_set_item.value.connect(an_item)
-        # Actually make the SetItem part of this set.
-        self.elements.connect(new_set_item)
+        # The item is located by its element id, it must therefore exist in the DBMS.
+        an_item._pre_action_check("_add_element")
+        # Whether the hash exists in the set or not is resolved at server side
+        self.cypher(_CYPHER_ADD, {"rows": [{"hash": f"{a_hash:x}", "value_id": an_item.element_id}]})
         return self
 
     def add_with_hash(self, an_item, a_hash):
@@ -450,9 +482,7 @@ class AbstractSet(CompositeAbstract):
         """
         if not isinstance(an_item, PersistentElement):
             raise TypeError(f"AbstractSet.add_with_hash() assignment expected PersistentElement, received {type(an_item)}")
-        # Get the hash of the key
-        if not self.contains_hash(a_hash):
-            self._add_element(an_item, a_hash)
+        self._add_element(an_item, a_hash)
 
     def retrieve_by_hash(self, a_hash):
         """
@@ -469,12 +499,10 @@ class AbstractSet(CompositeAbstract):
         :type a_hash: int
         :return: PersistentElement
         """
-        if self.contains_hash(a_hash):
-            nme = self.name
-            this_set_labels = ":".join(self.labels())
-            itm_hash = a_hash
-            return self.cypher(f"MATCH (a_set:{this_set_labels}{{name:'{nme}'}})-[:SET_ELEMENT]->(an_element:SetItem) WHERE an_element.hash_value='{itm_hash:x}' return an_element")[0][0]
-        raise KeyError(f"AbstractSet does not contain item with hash {a_hash:x}")
+        result, _ = self.cypher(_CYPHER_RETRIEVE_BY_HASH, {"hash": f"{a_hash:x}"})
+        if len(result) == 0:
+            raise KeyError(f"AbstractSet does not contain item with hash {a_hash:x}")
+        return result[0]
 
     def remove_by_hash(self, a_hash):
         """
@@ -488,12 +516,7 @@ class AbstractSet(CompositeAbstract):
         :type a_hash: int
         :return: AbstractSet (self)
         """
-        if self.contains_hash(a_hash):
-            nme = self.name
-            this_set_labels = ":".join(self.labels())
-            itm_hash = a_hash
-            self.cypher(f"MATCH (a_set:{this_set_labels}{{name:'{nme}'}})-[:SET_ELEMENT]->(an_element:SetItem) WHERE an_element.hash_value='{itm_hash:x}' DETACH DELETE an_element")
-        else:
+        if self.cypher(_CYPHER_REMOVE_BY_HASH, {"hash": f"{a_hash:x}"})[0][0][0] == 0:
             raise KeyError(f"AbstractSet does not contain item with hash {a_hash:x}")
         return self
 
@@ -507,24 +530,55 @@ class AbstractSet(CompositeAbstract):
 
         :param an_item: An object to be added to the AbstractSet.
         :type an_item: PersistentElement
+        :raises ObjectUnsavedError: When ``an_item`` has not been saved.
+        :raises ObjectDeletedError: When ``an_item`` has been deleted.
 
         :return: AbstractSet (self)
         """
         if not isinstance(an_item, PersistentElement):
             raise TypeError(f"AbstractSet.add() expected PersistentElement, received {type(an_item)}")
-        # Get the hash of the key
-        if not self.__contains__(an_item):
-            self._add_element(an_item, an_item._neoads_hash())
+        return self.add_many([an_item])
+
+    def add_many(self, items):
+        """
+        Adds a number of items to the set. Similar to Python's set.update().
+
+        .. note::
+
+            This is equivalent to a sequence of ``add()`` calls but the items are added at server side, with a single
+            query.
+
+        .. warning::
+
+            The items **must be hashable**.
+
+        :param items: An iterable of objects to be added to the AbstractSet.
+        :type items: iterable
+        :raises ObjectUnsavedError: When any of ``items`` has not been saved. The set is not modified.
+        :raises ObjectDeletedError: When any of ``items`` has been deleted. The set is not modified.
+
+        :return: AbstractSet (self)
+        """
+        self._pre_action_check("add_many")
+        rows = {}
+        for an_item in items:
+            if not isinstance(an_item, PersistentElement):
+                raise TypeError(f"AbstractSet.add_many() expected PersistentElement, received {type(an_item)}")
+            # The items are located by their element id, they must therefore exist in the DBMS.
+            an_item._pre_action_check("add_many")
+            a_hash = f"{an_item._neoads_hash():x}"
+            # Within the batch, the first item with a given hash is the one that is added, as with successive add()
+            rows.setdefault(a_hash, {"hash": a_hash, "value_id": an_item.element_id})
+        if len(rows) > 0:
+            self.cypher(_CYPHER_ADD, {"rows": list(rows.values())})
         return self
 
     def clear(self):
         """
         Clears the set.
         """
-        nme = self.name
-        this_set_labels = ":".join(self.labels())
         self._pre_action_check("clear")
-        self.cypher(f"MATCH (a_set:{this_set_labels}{{name:'{nme}'}})-[r1:SET_ELEMENT]->(el_item:SetItem)-[r2:ABSTRACT_STRUCT_ITEM_VALUE]->() DETACH DELETE r2,el_item,r1")
+        self.cypher(_CYPHER_CLEAR)
 
     def destroy(self):
         """
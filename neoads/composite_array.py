@@ -13,6 +13,11 @@ from . import exception
 import neomodel
 import datetime
 import hashlib
+import numbers
+
+
+# Empties the value of the composite variable ``$self``.
+_CYPHER_CLEAR = "MATCH (array) WHERE elementId(array)=$self SET array.value=[]"
 
 
 class VariableComposite(ElementVariable):
@@ -39,23 +44,24 @@ class VariableComposite(ElementVariable):
         Clears the array by writing an empty sequence to its value.
         """
         self._pre_action_check("clear")
-        # Notice here the level at which the query occurs. This method occurs in VariableComposite and is supposed to
-        # apply to all descendants. At the CYPHER level, this is applied via the query labels.
-        self.cypher(f"MATCH (array:{':'.join(self.labels())}{{name:'{self.name}'}}) SET array.value=[]")
+        # The query is anchored on the node's element id, so it applies to all descendants of VariableComposite
+        # without having to spell out their labels.
+        self.cypher(_CYPHER_CLEAR)
         # After applying the clear operation, perform a neomodel::refresh to update the status of the object.
         self.refresh()
 
     def __getitem__(self, key):
         self._pre_action_check('__getitem__')
 
-        if key>=0 and key<len(self.value):
-            return self.value[key]
+        value = self.value
+        if 0 <= key < len(value):
+            return value[key]
         else:
             raise IndexError(f"{self.__class__.__name__} index out of range")
             
     def __setitem__(self, key, value):
         self._pre_action_check('__setitem__')
-        if key>=0 and key<len(self.value):
+        if 0 <= key < len(self.value):
             self.value[key] = value
         else:
             raise IndexError(f"{self.__class__.__name__} assignment index out of range")
@@ -89,7 +95,7 @@ class CompositeString(VariableComposite):
         """
         Returns the hash of the string value.
         """
-        return int(hashlib.sha256(self.value.encode("utf-8")).hexdigest(), base=16)
+        return int.from_bytes(hashlib.sha256(self.value.encode("utf-8")).digest(), "big")
     
     
 class CompositeArrayString(VariableComposite):
@@ -118,12 +124,35 @@ class CompositeArrayNumber(VariableComposite):
     value = neomodel.ArrayProperty(neomodel.FloatProperty())
     
     def __setitem__(self, key, value):
-        if isinstance(value, float) or isinstance(value, int):
+        # numbers.Real covers Python's int and float as well as numpy's scalar types.
+        if isinstance(value, numbers.Real):
             return super().__setitem__(key, value)
         else:
             raise TypeError(f"CompositeArrayNumber assignment expects float received {type(value)}")
 
-    def from_query_IDs(self, query, refresh=True, auto_reset=False):
+    def __array__(self, dtype=None, copy=None):
+        """
+        Exposes the array to numpy as a contiguous ``float64`` array, so that ``numpy.asarray()``, ``numpy.sum()``
+        and other vectorised operations can consume a ``CompositeArrayNumber`` directly.
+
+        .. note::
+
+            The returned array is always a copy of ``value``. Changes to it are not written back to the node, use
+            item assignment (or set ``value``) and ``save()`` for that.
+
+        :param dtype: The numpy data type of the returned array (default ``float64``)
+        :param copy: As per the numpy array protocol. ``None`` and ``True`` return a copy, ``False`` raises
+                     ``ValueError`` because a copy cannot be avoided.
+        :raises ValueError: When ``copy`` is ``False``.
+        :returns: numpy.ndarray
+        """
+        self._pre_action_check("__array__")
+        if copy is False:
+            raise ValueError(f"{self.__class__.__name__} cannot be exposed to numpy without a copy")
+        import numpy
+        return numpy.array(self.value, dtype=dtype if dtype is not None else numpy.float64)
+
+    def from_query_IDs(self, query, refresh=True, auto_reset=False, params=None):
         """
         Executes a special type of query to populate the array of numbers with the IDs of the
         entities in the query.
@@ -153,6 +182,10 @@ class CompositeArrayNumber(VariableComposite):
         :type refresh: bool
         :param auto_reset: Whether to clear the list if it is found to be populated
         :type auto_reset: bool
+        :param params: Values for any ``$parameters`` used in ``query``. Passing values as parameters rather than
+                       formatting them in to ``query`` allows the server to re-use the query's plan. The parameter
+                       name ``self`` is reserved.
+        :type params: dict
         :returns: self
         """
         # TODO: MED, This is another remnant of an "older" way of doing things. With the advent of ArrayObjectBase,
@@ -165,9 +198,9 @@ class CompositeArrayNumber(VariableComposite):
         elif len(self)>0:
             raise exception.ContainerNotEmpty(f"Attempted to reset non-empty CompositeArrayNumber {self.name}")
 
-        self.cypher(f"MATCH (array:{':'.join(self.labels())}{{name:'{self.name}'}}) "
-                    f"WITH array {query} "
-                    f"WITH array, collect(distinct id(ListItem)) AS item_ids SET array.value=item_ids")
+        self.cypher(f"MATCH (array) WHERE elementId(array)=$self WITH array {query} "
+                    "WITH array, collect(distinct id(ListItem)) AS item_ids SET array.value=item_ids",
+                    params)
 
         if refresh:
             self.refresh()
@@ -11,6 +11,7 @@ The classes defined in this module can be used to store a specific **neo4j cyphe
 """
 import neomodel
 from .composite_array import VariableComposite
+from . import exception
 
 
 class CompositeArrayObjectBase(VariableComposite):
@@ -67,7 +68,7 @@ class CompositeArrayObjectList(CompositeArrayObjectBase):
     """
     def execute(self, params=None, refresh=True):
         items, attr = super().execute(params, refresh)
-        return list(map(lambda x: dict(zip(attr, x)), items))
+        return [dict(zip(attr, a_row)) for a_row in items]
 
 
 class CompositeArrayObjectDict(CompositeArrayObjectBase):
@@ -86,7 +87,8 @@ class CompositeArrayObjectDict(CompositeArrayObjectBase):
     """
     def execute(self, params=None, refresh=True):
         items, attr = super().execute(params, refresh)
-        return dict(map(lambda x: (x[0], dict(zip(attr[1:], x[1:]))), items))
+        value_attr = attr[1:]
+        return {a_row[0]: dict(zip(value_attr, a_row[1:])) for a_row in items}
 
 
 try:
@@ -102,8 +104,8 @@ try:
     
         """
         def execute(self, params=None, refresh=True):
-            items, attr = super().execute(params, refresh) 
-            return pandas.DataFrame(columns=attr, data=items, index=None)
+            items, attr = super().execute(params, refresh)
+            return pandas.DataFrame.from_records(items, columns=attr)
 except ImportError:
     pass
 
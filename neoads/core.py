@@ -28,6 +28,22 @@ class PersistentElement(neomodel.StructuredNode):
         """
         raise TypeError(f"Unhashable type {self.__class__.__name__}")
 
+    @classmethod
+    def _labels_str(cls):
+        """
+        Returns the labels of this class in the form they are used in CYPHER queries (e.g. ``A:B:C``).
+
+        .. note::
+
+            The labels are derived from the class hierarchy rather than retrieved from the DBMS and are cached per
+            class, so that building a query does not cost a round trip to the server.
+        """
+        try:
+            return cls.__dict__["_neoads_labels_str"]
+        except KeyError:
+            cls._neoads_labels_str = ":".join(cls.inherited_labels())
+            return cls._neoads_labels_str
+
     def _pre_action_check(self, action):
         """
         Handles pre-action checks specifically for neoads based models so that neoads exceptions with more informative
@@ -79,7 +95,7 @@ class ElementDomain(PersistentElement):
 
         """
         # return hash(tuple(map(lambda x: x[1], sorted(self.__properties__.items(), key=lambda x: x[0]))))
-        return int(hashlib.sha256(str(tuple(map(lambda x: x[1], sorted(self.__properties__.items(), key=lambda x: x[0])))).encode("utf-8")).hexdigest(), base=16)
+        return int.from_bytes(hashlib.sha256(str(tuple(map(lambda x: x[1], sorted(self.__properties__.items(), key=lambda x: x[0])))).encode("utf-8")).digest(), "big")
 
       
 
@@ -101,9 +101,9 @@ class MemoryManager:
         :type an_object_name: str
         :return: ElementVariable
         """
-        object_from_db, _ = neomodel.db.cypher_query("MATCH (anObject:ElementVariable{{name:'{object_name}'}}) "
-                                                     "return anObject".format(
-                                                    **{"object_name": an_object_name}), resolve_objects=True)
+        object_from_db, _ = neomodel.db.cypher_query("MATCH (anObject:ElementVariable{name:$object_name}) "
+                                                     "return anObject",
+                                                     {"object_name": an_object_name}, resolve_objects=True)
         if len(object_from_db) != 1:
             raise exception.ObjectNotFound(f"Object with name {an_object_name} not found")
         else:
@@ -38,7 +38,7 @@ class VariableSimple(ElementVariable):
         In general, simple variable values are expected to be able to be converted to 
         string in a straightforward way.
         """
-        return int(hashlib.sha256(str(self.value).encode("utf-8")).hexdigest(), base=16)
+        return int.from_bytes(hashlib.sha256(str(self.value).encode("utf-8")).digest(), "big")
 
 
 class SimpleNumber(VariableSimple):
@@ -64,12 +64,94 @@ def test_delitem():
     [an_item.delete() for an_item in elements]
 
 
+def test_getitem():
+    """
+    AbstractDLList should return the item at any position of the list, including after an item has been deleted.
+    """
+    # Create some generic content that is to be added to the DLList
+    elements = [neoads.SimpleNumber(random.random()).save() for i in range(0, 10)]
+    # # Create and populate the DLList
+    u = neoads.AbstractDLList().save()
+    [u.append(an_element) for an_element in elements]
+    # Run the test
+    assert all([u[idx] == an_element for idx, an_element in enumerate(elements)])
+    # Negative indices count from the end of the list
+    assert u[-1] == elements[-1]
+    # Indices out of bounds should be rejected
+    with pytest.raises(IndexError):
+        u[len(elements)]
+    # Delete an item and make sure that the items that follow it have moved one position down
+    del(u[3])
+    del(elements[3])
+    assert all([u[idx] == an_element for idx, an_element in enumerate(elements)])
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in elements]
+
+
+def test_extend():
+    """
+    AbstractDLList should append all elements of an iterable, whether it is empty or not.
+    """
+    # Create some generic content that is to be added to the DLList
+    elements = [neoads.SimpleNumber(random.random()).save() for i in range(0, 10)]
+    # # Create and populate the DLList
+    u = neoads.AbstractDLList().save()
+    u.extend(elements[0:5])
+    u.extend(elements[5:10])
+    # Run the test
+    assert len(u) == len(elements)
+    assert all([u[idx] == an_element for idx, an_element in enumerate(elements)])
+    assert all([v == elements[idx] for idx, v in enumerate(u.iterforward())])
+    assert u.get_tail().value.get() == elements[-1]
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in elements]
+
+
+def test_append_unsaved():
+    """
+    AbstractDLList should reject elements that do not exist in the DBMS and remain unchanged.
+    """
+    an_element = neoads.SimpleNumber(random.random()).save()
+    u = neoads.AbstractDLList().save()
+    u.append(an_element)
+    # Run the test
+    with pytest.raises(neoads.ObjectUnsavedError):
+        u.append(neoads.SimpleNumber(random.random()))
+    assert len(u) == 1
+    with pytest.raises(neoads.ObjectUnsavedError):
+        u.extend([an_element, neoads.SimpleNumber(random.random())])
+    assert len(u) == 1
+    assert u.get_tail().value.get() == an_element
+    # Clean up
+    u.destroy()
+    an_element.delete()
+
+
+def test_tail():
+    """
+    AbstractDLList should keep track of its tail as items are appended and deleted.
+    """
+    # Create some generic content that is to be added to the DLList
+    elements = [neoads.SimpleNumber(random.random()).save() for i in range(0, 4)]
+    # # Create and populate the DLList
+    u = neoads.AbstractDLList().save()
+    [u.append(an_element) for an_element in elements]
+    # Run the test
+    assert u.get_tail().value.get() == elements[-1]
+    # Deleting the last item should move the tail to the previous item
+    del(u[len(u)-1])
+    assert u.get_tail().value.get() == elements[-2]
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in elements]
+
+
 def test_extend_by_merging():
     """
     AbstractDLList should extend itself by another AbstractDLList
     """
-    # TODO: HIGH, This test does not cover the cases where given two lists u,v with v to be merged on to u, either of
-    #       the lists are emtpy. Must add these two test cases.
     # Create some generic content that is to be added to the DLLists by query
     elements = [neoads.SimpleNumber(random.random()).save() for i in range(0, 4)]
     # # Create and populate the DLLists
@@ -89,6 +171,32 @@ def test_extend_by_merging():
     [an_item.delete() for an_item in elements]
 
 
+def test_extend_by_merging_empty():
+    """
+    AbstractDLList should extend itself by another AbstractDLList when either of the lists is empty.
+    """
+    # Create some generic content that is to be added to the DLLists
+    elements = [neoads.SimpleNumber(random.random()).save() for i in range(0, 4)]
+    # Merge a non-empty list into an empty one
+    u = neoads.AbstractDLList().save()
+    v = neoads.AbstractDLList().save()
+    v.extend(elements)
+    u.extend_by_merging(v)
+    assert len(u) == len(elements)
+    assert all([u[idx] == an_element for idx, an_element in enumerate(elements)])
+    # Merge an empty list into a non-empty one
+    w = neoads.AbstractDLList().save()
+    w_list_name = w.name
+    u.extend_by_merging(w)
+    with pytest.raises(neomodel.exceptions.DoesNotExist):
+        neoads.AbstractDLList.nodes.get(name=w_list_name)
+    assert len(u) == len(elements)
+    assert u.get_tail().value.get() == elements[-1]
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in elements]
+
+
 def test_from_query():
     """
     AbstractDLList should be capable of initialising from a special **INCOMPLETE** READ CYPHER Query.
@@ -106,6 +214,23 @@ def test_from_query():
     [an_item.delete() for an_item in elements]
 
 
+def test_from_query_with_params():
+    """
+    AbstractDLList should be capable of initialising from a parameterised **INCOMPLETE** READ CYPHER Query.
+    """
+    # Create some generic content that is to be added to the DLList by query
+    elements = [neoads.SimpleNumber(random.random()).save() for i in range(0, 10)]
+    # Create and populate the DLList
+    u = neoads.AbstractDLList().save()
+    u.from_query("MATCH (ListItem:SimpleNumber) WHERE ListItem.name IN $element_names",
+                 params={"element_names": [an_element.name for an_element in elements]})
+    # Run the test
+    assert len(u) == len(elements)
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in elements]
+
+
 def test_from_id_array():
     """
     AbstractDLList should be capable of initialising from a CompositeArrayNumber that contains IDs
@@ -128,6 +253,33 @@ def test_from_id_array():
     [an_item.delete() for an_item in elements]
 
 
+def test_query_fragments():
+    """
+    The query fragments generated by AbstractDLList should be usable as parts of complete queries.
+    """
+    # Create some generic content that is to be added to the DLList
+    elements = [neoads.SimpleNumber(random.random()).save() for i in range(0, 4)]
+    # # Create and populate the DLList
+    u = neoads.AbstractDLList().save()
+    u.extend(elements)
+    # Run the test
+    result, _ = neomodel.db.cypher_query(u.project_as("a_list", "a_list_ids") + "RETURN a_list_ids")
+    element_ids, _ = neomodel.db.cypher_query("UNWIND $element_ids AS element_id MATCH (n) WHERE elementId(n)=element_id "
+                                              "RETURN collect(id(n))",
+                                              {"element_ids": [an_element.element_id for an_element in elements]})
+    assert result[0][0] == element_ids[0][0]
+    result, _ = neomodel.db.cypher_query(u.project_as("a_list", "a_list_values", projected_field="value") +
+                                         "RETURN a_list_values")
+    assert sorted(result[0][0]) == sorted([an_element.value for an_element in elements])
+    result, _ = neomodel.db.cypher_query(u.with_this_list_as("a_list_values") + " RETURN size(a_list_values)")
+    assert result[0][0] == len(elements)
+    result, _ = neomodel.db.cypher_query(u.iterate_by_query("a_list") + "RETURN count(a_list_listItemValue)")
+    assert result[0][0] == len(elements)
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in elements]
+
+
 def test_iteratorforward():
     """
     Forward iterator should return items from head to tail
@@ -161,3 +313,45 @@ def test_iteratorreverse():
     u.destroy()
     [an_item.delete() for an_item in elements]
 
+
+def test_query_fragments_quoted_name():
+    """
+    The query fragments generated by AbstractDLList should remain valid for list names that contain quotes.
+    """
+    elements = [neoads.SimpleNumber(random.random()).save() for i in range(0, 2)]
+    u = neoads.AbstractDLList(name="The 'quoted' list").save()
+    u.extend(elements)
+    result, _ = neomodel.db.cypher_query(u.iterate_by_query("a_list") + "RETURN count(a_list_listItemValue)")
+    assert result[0][0] == len(elements)
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in elements]
+
+
+def test_ensure_indexes_upgrades_earlier_lists():
+    """
+    AbstractDLList.ensure_indexes() should upgrade lists stored in the layout of earlier versions.
+    """
+    elements = [neoads.SimpleNumber(random.random()).save() for i in range(0, 4)]
+    u = neoads.AbstractDLList().save()
+    u.extend(elements)
+    # Strip the list down to the earlier layout, where only the chain of DLL_NXT/DLL_PRV links was kept.
+    u.cypher("MATCH (a_list) WHERE elementId(a_list)=$self "
+             "MATCH (a_list)-[tail_link:DLL_TAIL]->(:DLListItem) "
+             "MATCH (an_item:DLListItem{list_name:a_list.name}) "
+             "REMOVE a_list.item_ids, an_item.list_name, an_item.item_id "
+             "DELETE tail_link")
+    # Run the test
+    neoads.AbstractDLList.ensure_indexes()
+    u.refresh()
+    assert len(u) == len(elements)
+    assert all([u[idx] == an_element for idx, an_element in enumerate(elements)])
+    assert u.get_tail().value.get() == elements[-1]
+    result, _ = neomodel.db.cypher_query(u.project_as("a_list", "a_list_ids") + "RETURN a_list_ids")
+    element_ids, _ = neomodel.db.cypher_query("UNWIND $element_ids AS element_id MATCH (n) WHERE elementId(n)=element_id "
+                                              "RETURN collect(id(n))",
+                                              {"element_ids": [an_element.element_id for an_element in elements]})
+    assert result[0][0] == element_ids[0][0]
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in elements]
@@ -71,6 +71,67 @@ def test_len():
     [(an_item[0].delete(), an_item[1].delete()) for an_item in elements]
 
 
+def test_setitem():
+    """
+    Assigning to an existing key of an AbstractMap should replace its value without adding a new entry.
+    """
+    key = neoads.CompositeString("One").save()
+    first_value = neoads.SimpleNumber(1.0).save()
+    second_value = neoads.SimpleNumber(2.0).save()
+    # Create and populate the map
+    u = neoads.AbstractMap().save()
+    u[key] = first_value
+    u[key] = second_value
+    # Run the test
+    assert len(u) == 1
+    assert u[key] == second_value
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in [key, first_value, second_value]]
+
+
+def test_update():
+    """
+    AbstractMap should be updated with all key, value pairs of a mapping.
+    """
+    # Create some generic content that is to be added to the map
+    data = {"One": 1.0, "Two": 2.0, "Three": 3.0, "Four": 4.0}
+    elements = [(neoads.CompositeString(an_item[0]).save(), neoads.SimpleNumber(an_item[1]).save())
+                for an_item in data.items()]
+    # Create and populate the map
+    u = neoads.AbstractMap().save()
+    u[elements[0][0]] = elements[1][1]
+    u.update(elements)
+    # Run the test
+    assert len(u) == len(elements)
+    assert all([u[an_item[0]] == an_item[1] for an_item in elements])
+    # Clean up
+    u.destroy()
+    [(an_item[0].delete(), an_item[1].delete()) for an_item in elements]
+
+
+def test_setitem_unsaved():
+    """
+    AbstractMap should reject keys and values that do not exist in the DBMS and remain unchanged.
+    """
+    key = neoads.CompositeString("One").save()
+    value = neoads.SimpleNumber(1.0).save()
+    u = neoads.AbstractMap().save()
+    u[key] = value
+    # Run the test
+    with pytest.raises(neoads.ObjectUnsavedError):
+        u[key] = neoads.SimpleNumber(2.0)
+    with pytest.raises(neoads.ObjectUnsavedError):
+        u[neoads.CompositeString("Two")] = value
+    with pytest.raises(neoads.ObjectUnsavedError):
+        u.update([(neoads.CompositeString("Three"), value)])
+    assert len(u) == 1
+    assert u[key] == value
+    # Clean up
+    u.destroy()
+    [an_item.delete() for an_item in [key, value]]
+
+
 # TODO: HIGH, The __len__ operator should be generalised and added to the `test_DataTypeFeatures.py` tests.
 def test_delitem():
     """
@@ -87,6 +148,33 @@ def test_delitem():
     # Run the test
     del u[elements[0][0]]
     assert elements[0][0] not in u
+    # Accessing or deleting a missing key should raise KeyError
+    with pytest.raises(KeyError):
+        u[elements[0][0]]
+    with pytest.raises(KeyError):
+        del u[elements[0][0]]
+    assert u.get(elements[0][0]) is None
+    assert u.get(elements[0][0], elements[0][1]) == elements[0][1]
+    assert u.get(elements[1][0]) == elements[1][1]
+    # Clean up
+    u.destroy()
+    [(an_item[0].delete(), an_item[1].delete()) for an_item in elements]
+
+
+def test_keys_values():
+    """
+    The keys and values of an AbstractMap should be iterable, regardless of how many pages they are retrieved in.
+    """
+    data = {"One": 1.0, "Two": 2.0, "Three": 3.0, "Four": 4.0, "Five": 5.0}
+    elements = [(neoads.CompositeString(an_item[0]).save(), neoads.SimpleNumber(an_item[1]).save())
+                for an_item in data.items()]
+    u = neoads.AbstractMap().save()
+    assert u.keys is None
+    u.update(elements)
+    # Force more than one page
+    u._page_size = 2
+    assert sorted(a_key.value for a_key in u.keys) == sorted(data.keys())
+    assert sorted(a_value.value for a_value in u.values) == sorted(data.values())
     # Clean up
     u.destroy()
     [(an_item[0].delete(), an_item[1].delete()) for an_item in elements]
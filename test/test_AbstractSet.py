@@ -109,6 +109,10 @@ def test_from_abstractset():
         some_numbers[1] in another_set and \
         some_numbers[2] in another_set and \
         some_numbers[3] in another_set, "from_abstractset() produced set with invalid contents"
+    # A populated set should only be overwritten if auto_reset is requested
+    with pytest.raises(neoads.ContainerNotEmpty):
+        another_set.from_abstractset(some_set)
+    assert len(another_set) == len(some_set)
 
     # Get rid of the nodes that were created for this test
     another_set.destroy()
@@ -145,6 +149,50 @@ def test_add():
     s4.delete()
 
 
+def test_add_many():
+    """
+    AbstractSet should add many elements at once, skipping those that are already in the set.
+    """
+
+    s1 = neoads.CompositeString("Alpha").save()
+    s2 = neoads.CompositeString("Beta").save()
+    s3 = neoads.CompositeString("Gamma").save()
+    s4 = neoads.CompositeString("Gamma").save()
+
+    u = neoads.AbstractSet().save()
+    u.add(s1)
+    u.add_many([s1, s2, s3, s4])
+
+    assert len(u) == 3
+    assert s1 in u and s2 in u and s3 in u
+
+    u.destroy()
+    s1.delete()
+    s2.delete()
+    s3.delete()
+    s4.delete()
+
+
+def test_add_unsaved():
+    """
+    AbstractSet should reject elements that do not exist in the DBMS and remain unchanged.
+    """
+
+    s1 = neoads.CompositeString("Alpha").save()
+
+    u = neoads.AbstractSet().save()
+    u.add(s1)
+
+    with pytest.raises(neoads.ObjectUnsavedError):
+        u.add(neoads.CompositeString("Beta"))
+    with pytest.raises(neoads.ObjectUnsavedError):
+        u.add_many([neoads.CompositeString("Gamma")])
+    assert len(u) == 1
+
+    u.destroy()
+    s1.delete()
+
+
 def test_is_not_hashable():
     """
     AbstractSet (itself) should NOT be hashable
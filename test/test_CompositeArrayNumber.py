@@ -7,6 +7,7 @@ Tests functionality that is specific to CompositeArrayNumber and is not covered
 """
 
 from neoads import CompositeArrayNumber, SimpleNumber
+import pytest
 
 
 def test_init_from_query_IDs():
@@ -42,3 +43,56 @@ def test_init_from_query_IDs():
     # Get rid of the nodes that were created to run this test
     some_array.delete()
     [an_item.delete() for an_item in some_numbers]
+
+
+def test_init_from_query_IDs_params():
+    """
+    Tests initialisation of a CompositeArrayNumber via its from_query_IDs() function with a parameterised query.
+    """
+
+    # Setup some generic content first
+    some_numbers = [SimpleNumber(an_item).save() for an_item in range(0, 10)]
+    # The names of the numbers are passed as a parameter rather than formatted in to the query
+    number_variable_names = [a_number.name for a_number in some_numbers]
+    # Create the array itself. Here, an empty list is created.
+    some_array = CompositeArrayNumber([]).save()
+    # Populate the array with the IDs of specific nodes
+    some_array.from_query_IDs("MATCH (ListItem:SimpleNumber) "
+                              "WHERE ListItem.name IN $names AND "
+                              "ListItem.value>2 AND ListItem.value<8",
+                              params={"names": number_variable_names})
+    u = CompositeArrayNumber.nodes.get(name=some_array.name)
+    # There are 10 numbers in some_numbers, but only 5 of them within 2 < x < 8 (3,4,5,6,7)
+    assert len(u) == 5, "CompositeArrayNumber.from_query_IDs() has returned incorrect length"
+    assert [int(an_id) for an_id in u.value] == [a_number.id for a_number in some_numbers[3:8]], \
+        "CompositeArrayNumber.from_query_IDs() populated the array with incorrect results"
+    # Get rid of the nodes that were created to run this test
+    some_array.delete()
+    [an_item.delete() for an_item in some_numbers]
+
+
+def test_array_protocol():
+    """
+    Tests that a CompositeArrayNumber can be consumed directly by numpy.
+    """
+    numpy = pytest.importorskip("numpy")
+    some_array = CompositeArrayNumber([1.0, 2.0, 3.5]).save()
+    as_array = numpy.asarray(some_array)
+    assert as_array.dtype == numpy.float64
+    assert as_array.tolist() == [1.0, 2.0, 3.5]
+    assert numpy.sum(some_array) == 6.5
+    # numpy scalars are accepted on assignment
+    some_array[0] = numpy.int64(4)
+    some_array[1] = numpy.float32(0.5)
+    assert numpy.sum(some_array) == 8.0
+    some_array.delete()
+
+
+def test_array_protocol_no_copy():
+    """
+    Tests that a CompositeArrayNumber refuses to be exposed to numpy without a copy.
+    """
+    some_array = CompositeArrayNumber([1.0, 2.0, 3.5]).save()
+    with pytest.raises(ValueError):
+        some_array.__array__(copy=False)
+    some_array.delete()